@@ -0,0 +1,398 @@
+"""In-memory stand-in for the parts of Selenium that the form-filling code uses.
+
+Forms are built from the same declarative field lists as the fixture site
+(FixtureConfig.form()), and every call that would be a WebDriver HTTP round trip
+is counted on the driver, so the Python-side cost and the round trips per
+question of JobsPage.try_fill_* can be measured without a browser.
+"""
+
+import json
+import re
+from functools import lru_cache
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+TOKEN = re.compile(
+    r"""\s*(?P<comb>[+>])\s*|(?P<space>\s+)|(?P<tag>[a-zA-Z][\w-]*)|\.(?P<cls>[\w-]+)"""
+    r"""|\[(?P<attr>[\w-]+)(?:=['"]?(?P<val>[^'"\]]*)['"]?)?\]|:(?P<pseudo>checked)"""
+    r"""|:not\(\.(?P<notcls>[\w-]+)\)"""
+)
+PRECEDING = re.compile(r"preceding::(\w+)\[contains\(@class, '([\w-]+)'\)\]\[1\]")
+
+
+class Compound:
+    def __init__(self):
+        self.tag = None
+        self.classes = []
+        self.attrs = []
+        self.checked = False
+        self.not_classes = []
+
+    def matches(self, el):
+        if self.tag and el.tag != self.tag:
+            return False
+        if any(c not in el.classes for c in self.classes):
+            return False
+        if any(c in el.classes for c in self.not_classes):
+            return False
+        for name, value in self.attrs:
+            if name not in el.attrs or (value is not None and el.attrs[name] != value):
+                return False
+        if self.checked and not el.checked:
+            return False
+        return True
+
+
+@lru_cache(maxsize=None)
+def parse_selector(selector):
+    """Parse the CSS subset used by the pages: tags, classes, attributes, :checked, :not(.x), ' ' and '+'."""
+    parts = [("", Compound())]
+    pos = 0
+    selector = selector.strip()
+    while pos < len(selector):
+        m = TOKEN.match(selector, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"Unsupported selector: {selector}")
+        pos = m.end()
+        compound = parts[-1][1]
+        if m.group("comb") or m.group("space"):
+            parts.append((m.group("comb") or " ", Compound()))
+        elif m.group("tag"):
+            compound.tag = m.group("tag")
+        elif m.group("cls"):
+            compound.classes.append(m.group("cls"))
+        elif m.group("attr"):
+            compound.attrs.append((m.group("attr"), m.group("val")))
+        elif m.group("pseudo"):
+            compound.checked = True
+        elif m.group("notcls"):
+            compound.not_classes.append(m.group("notcls"))
+    return parts
+
+
+class FakeElement:
+    def __init__(self, driver, tag, classes="", text="", children=(), **attrs):
+        self.driver = driver
+        self.tag = tag
+        self.classes = classes.split()
+        self.own_text = text
+        self.attrs = {name.rstrip("_").replace("_", "-"): value for name, value in attrs.items()}
+        self.value = self.attrs.get("value", "")
+        self.checked = "checked" in self.attrs
+        self.parent = None
+        self.children = []
+        for child in children:
+            self.append(child)
+
+    def append(self, child):
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    # Tree helpers, free of round trips
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+    def previous_sibling(self):
+        if self.parent is None:
+            return None
+        siblings = self.parent.children
+        index = siblings.index(self)
+        return siblings[index - 1] if index else None
+
+    def matches(self, parts, index=None):
+        index = len(parts) - 1 if index is None else index
+        combinator, compound = parts[index]
+        if not compound.matches(self):
+            return False
+        if index == 0:
+            return True
+        if combinator == "+":
+            sibling = self.previous_sibling()
+            return sibling is not None and sibling.matches(parts, index - 1)
+        ancestor = self.parent
+        while ancestor is not None:
+            if ancestor.matches(parts, index - 1):
+                return True
+            ancestor = ancestor.parent
+        return False
+
+    def select(self, by, value):
+        if by == By.CSS_SELECTOR:
+            parts = parse_selector(value)
+            return [el for el in self.descendants() if el.matches(parts)]
+        if by == By.XPATH:
+            m = PRECEDING.fullmatch(value)
+            if not m:
+                raise ValueError(f"Unsupported XPath: {value}")
+            tag, cls = m.groups()
+            ancestors = set()
+            node = self
+            while node is not None:
+                ancestors.add(id(node))
+                node = node.parent
+            preceding = []
+            for el in self.driver.root.descendants():
+                if el is self:
+                    break
+                if id(el) not in ancestors and el.tag == tag and cls in el.classes:
+                    preceding.append(el)
+            return preceding[-1:]
+        raise ValueError(f"Unsupported locator strategy: {by}")
+
+    def visible_text(self):
+        if "visually-hidden" in self.classes:
+            return ""
+        parts = [self.own_text] + [child.visible_text() for child in self.children]
+        return " ".join(part for part in parts if part).strip()
+
+    def current_value(self):
+        if self.tag == "select":
+            selected = [option for option in self.children if option.checked] or self.children[:1]
+            return selected[0].attrs.get("value", "") if selected else ""
+        return self.value
+
+    # Selenium API, one round trip each
+
+    def find_element(self, by=By.ID, value=None):
+        self.driver.round_trip("find_element")
+        found = self.select(by, value)
+        if not found:
+            raise NoSuchElementException(f"No element for {value}")
+        return found[0]
+
+    def find_elements(self, by=By.ID, value=None):
+        self.driver.round_trip("find_elements")
+        return self.select(by, value)
+
+    def get_attribute(self, name):
+        self.driver.round_trip("get_attribute")
+        if name == "value":
+            return self.current_value()
+        return self.attrs.get(name)
+
+    @property
+    def text(self):
+        self.driver.round_trip("text")
+        return self.visible_text()
+
+    def is_selected(self):
+        self.driver.round_trip("is_selected")
+        return self.checked
+
+    def send_keys(self, *values):
+        self.driver.round_trip("send_keys")
+        self.value += "".join(str(value) for value in values)
+
+    def click(self):
+        self.driver.round_trip("click")
+        self.activate()
+
+    def activate(self):
+        if self.tag == "input" and self.attrs.get("type") == "radio":
+            for el in self.driver.root.descendants():
+                if el.attrs.get("name") == self.attrs.get("name"):
+                    el.checked = False
+            self.checked = True
+        elif self.tag == "option":
+            for option in self.parent.children:
+                option.checked = False
+            self.checked = True
+        elif self.tag == "label" and "for" in self.attrs:
+            for el in self.driver.root.descendants():
+                if el.attrs.get("id") == self.attrs["for"]:
+                    el.activate()
+
+
+class FakeDriver:
+    """Counts every simulated WebDriver command in round_trips and calls_by_command."""
+
+    def __init__(self, fields, current_url="https://www.linkedin.com/jobs/search/?currentJobId=1"):
+        self.current_url_value = current_url
+        self.round_trips = 0
+        self.calls_by_command = {}
+        self.root = FakeElement(self, "body")
+        self.questions = 0
+        content = self.root.append(FakeElement(self, "div", "jobs-easy-apply-content"))
+        for index, field in enumerate(fields):
+            content.append(self.build_field(field, index))
+            if field["type"] != "FILE":
+                self.questions += 1
+
+    def round_trip(self, command):
+        self.round_trips += 1
+        self.calls_by_command[command] = self.calls_by_command.get(command, 0) + 1
+
+    @property
+    def current_url(self):
+        self.round_trip("current_url")
+        return self.current_url_value
+
+    def find_element(self, by=By.ID, value=None):
+        return self.root.find_element(by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self.root.find_elements(by, value)
+
+    def execute_script(self, script, *args):
+        self.round_trip("execute_script")
+        handler = self.scripts.get(script)
+        if handler is None:
+            raise ValueError("Script not emulated by FakeDriver")
+        return handler(self, *args)
+
+    def build_field(self, field, index):
+        E = lambda *a, **kw: FakeElement(self, *a, **kw)  # noqa: E731
+        name = f"f{index}"
+        if field["type"] == "FILE":
+            return E(
+                "div",
+                "pb4",
+                children=[
+                    E("span", role="button", text="Upload resume"),
+                    E("input", type="file"),
+                    E("input", type="radio", name=name, id=name, checked=""),
+                    E("label", for_=name, text="resume.pdf"),
+                ],
+            )
+
+        if field["type"] == "RADIO":
+            options = []
+            for j, option in enumerate(field["options"]):
+                options.append(
+                    E(
+                        "div",
+                        "fb-text-selectable__option",
+                        children=[
+                            E("input", type="radio", name=name, id=f"{name}_{j}", value=option),
+                            E("label", for_=f"{name}_{j}", text=option),
+                        ],
+                    )
+                )
+            legend = E("legend", children=[E("span", aria_hidden="true", text=field["question"])])
+            control = [E("fieldset", children=[legend] + options)]
+        elif field["type"] == "DROPDOWN":
+            select = E("select", id=name)
+            for option in ["Select an option"] + field["options"]:
+                select.append(E("option", value=option, text=option))
+            label = E(
+                "label",
+                for_=name,
+                children=[E("span", text=field["question"]), E("span", "visually-hidden", text=field["question"])],
+            )
+            control = [label, select]
+        else:
+            label = E("label", for_=name, children=[E("span", aria_hidden="true", text=field["question"])])
+            control = [label, E("input", type="text", id=name)]
+
+        return E(
+            "div",
+            "pb4",
+            children=[
+                E(
+                    "div",
+                    "jobs-easy-apply-form-section__grouping",
+                    children=[E("div", "jobs-easy-apply-form-element", children=control)],
+                )
+            ],
+        )
+
+
+def snapshot_form(driver):
+    """Python twin of scripts.SNAPSHOT_FORM over the fake tree."""
+    sections = [el for el in driver.root.select(By.CSS_SELECTOR, ".jobs-easy-apply-content div.pb4")]
+    uploads = [section for section in sections if section.select(By.CSS_SELECTOR, "input[type='file']")]
+    fields = []
+    for section in sections:
+        for group in section.select(By.CSS_SELECTOR, "div.jobs-easy-apply-form-section__grouping"):
+            radios = group.select(By.CSS_SELECTOR, ".fb-text-selectable__option input")
+            radio_label = group.select(By.CSS_SELECTOR, "div.jobs-easy-apply-form-element legend span[aria-hidden='true']")
+            select = group.select(By.CSS_SELECTOR, "select")
+            inputs = [
+                el
+                for el in group.descendants()
+                if el.tag == "textarea" or (el.tag == "input" and el.attrs.get("type") != "file")
+            ]
+            if radio_label and radios:
+                checked = [radio for radio in radios if radio.checked]
+                fields.append(
+                    {
+                        "element": group,
+                        "type": "RADIO",
+                        "question": radio_label[0].visible_text(),
+                        "options": [radio.attrs.get("value") for radio in radios],
+                        "value": checked[0].attrs.get("value") if checked else None,
+                    }
+                )
+            elif select:
+                label = group.select(By.CSS_SELECTOR, "label span:not(.visually-hidden)")
+                options = [o for o in select[0].children if o.attrs.get("value") not in ["", "Select an option"]]
+                value = select[0].current_value()
+                fields.append(
+                    {
+                        "element": group,
+                        "type": "DROPDOWN",
+                        "question": label[0].visible_text(),
+                        "options": [o.visible_text() for o in options],
+                        "value": None if value in ["", "Select an option"] else value,
+                    }
+                )
+            elif inputs:
+                label = group.select(By.CSS_SELECTOR, "label span[aria-hidden='true']") or group.select(
+                    By.CSS_SELECTOR, "label"
+                )
+                fields.append(
+                    {
+                        "element": group,
+                        "type": "TEXT",
+                        "question": label[0].visible_text(),
+                        "options": None,
+                        "value": inputs[0].value or None,
+                    }
+                )
+    structure = [[field["type"], field["question"], field["options"]] for field in fields]
+    signature = json.dumps(structure, separators=(",", ":"), ensure_ascii=False)
+    return {"uploads": uploads, "fields": fields, "signature": signature}
+
+
+def apply_form(driver, updates):
+    """Python twin of scripts.APPLY_FORM over the fake tree."""
+    failed = []
+    for index, (group, type, value) in enumerate(updates):
+        try:
+            if type == "RADIO":
+                radio = [r for r in group.select(By.CSS_SELECTOR, ".fb-text-selectable__option input") if r.attrs.get("value") == value]
+                radio[0].activate()
+            elif type == "DROPDOWN":
+                select = group.select(By.CSS_SELECTOR, "select")[0]
+                option = [o for o in select.children if o.visible_text() == value or o.attrs.get("value") == value]
+                option[0].activate()
+            else:
+                inputs = [el for el in group.descendants() if el.tag in ["input", "textarea"]]
+                inputs[0].value = value
+        except (IndexError, KeyError):
+            failed.append(index)
+    return failed
+
+
+def replay_form(driver, signature, updates):
+    """Python twin of scripts.REPLAY_FORM over the fake tree."""
+    snapshot = snapshot_form(driver)
+    if snapshot["signature"] != signature:
+        return {"snapshot": snapshot, "failed": None}
+    updates = [update for update in updates if not snapshot["fields"][update[0]]["value"]]
+    failed = apply_form(driver, [[snapshot["fields"][index]["element"], type, value] for index, type, value in updates])
+    return {"snapshot": snapshot, "failed": [updates[i][0] for i in failed]}
+
+
+def register_scripts():
+    # Imported lazily so the fake has no hard dependency on the pages package layout
+    from pages.scripts import SNAPSHOT_FORM, APPLY_FORM, REPLAY_FORM
+
+    FakeDriver.scripts = {SNAPSHOT_FORM: snapshot_form, APPLY_FORM: apply_form, REPLAY_FORM: replay_form}
+
+
+FakeDriver.scripts = {}
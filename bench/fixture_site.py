@@ -0,0 +1,326 @@
+"""Local replica of the LinkedIn jobs search and Easy Apply pages.
+
+It only reproduces the markup and behaviour that JobsPage depends on: the results list, the
+unified top card, the Easy Apply button, the multi-step modal with its progress meter and
+radio, dropdown, text and file groupings, and the discard confirmation dialog.
+
+Run standalone with `python bench/fixture_site.py --port 8000` and open
+http://127.0.0.1:8000/jobs/search
+"""
+
+import argparse
+import html
+import json
+import threading
+from datetime import date, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+TITLES = ["Software Engineer", "Backend Engineer", "Senior Staff Engineer", "Python Developer", "Full Stack Engineer"]
+LOCATIONS = ["United States (Remote)", "Phoenix, AZ", "New York, NY", "Austin, TX"]
+
+RADIO_QUESTIONS = [
+    ("Are you legally authorized to work in the United States?", ["Yes", "No"]),
+    ("Will you now or in the future require sponsorship?", ["Yes", "No"]),
+    ("Are you comfortable working remotely?", ["Yes", "No"]),
+]
+DROPDOWN_QUESTIONS = [
+    ("What is your level of proficiency in English?", ["None", "Conversational", "Professional", "Native"]),
+    ("Highest level of education completed", ["High School", "Bachelor's Degree", "Master's Degree"]),
+]
+TEXT_QUESTIONS = [
+    "First name",
+    "Last name",
+    "Mobile phone number",
+    "City",
+    "How many years of work experience do you have with Python?",
+    "How many years of experience do you have with Java?",
+    "What are your salary expectations?",
+]
+
+
+class FixtureConfig:
+    def __init__(
+        self,
+        pages=2,
+        page_size=25,
+        steps=3,
+        radios=1,
+        dropdowns=1,
+        texts=2,
+        files=1,
+        applied_ratio=0.2,
+        latency_ms=50,
+    ):
+        self.pages = pages
+        self.page_size = page_size
+        self.steps = steps
+        self.radios = radios
+        self.dropdowns = dropdowns
+        self.texts = texts
+        self.files = files
+        self.applied_ratio = applied_ratio
+        self.latency_ms = latency_ms
+
+    def jobs(self):
+        jobs = []
+        for i in range(self.pages * self.page_size):
+            jobs.append(
+                {
+                    "id": str(4000000000 + i),
+                    "title": TITLES[i % len(TITLES)],
+                    "company": f"Company {i % 37}",
+                    "location": LOCATIONS[i % len(LOCATIONS)],
+                    "posted": f"{i % 14 + 1} days ago",
+                    "listed": (date.today() - timedelta(days=i % 14 + 1)).isoformat(),
+                    "applicants": f"{(i * 37) % 900 + 1} applicants",
+                    # Spread applied jobs evenly and deterministically
+                    "applied": (i * 7919) % 100 < self.applied_ratio * 100,
+                }
+            )
+        return jobs
+
+    def form(self):
+        """The Easy Apply steps; every job uses the same form so runs are comparable."""
+        steps = []
+        n = 0
+        for step in range(self.steps):
+            fields = []
+            for _ in range(self.files if step == 0 else 0):
+                fields.append({"type": "FILE"})
+            for _ in range(self.radios):
+                question, options = RADIO_QUESTIONS[n % len(RADIO_QUESTIONS)]
+                fields.append({"type": "RADIO", "question": question, "options": options})
+                n += 1
+            for _ in range(self.dropdowns):
+                question, options = DROPDOWN_QUESTIONS[n % len(DROPDOWN_QUESTIONS)]
+                fields.append({"type": "DROPDOWN", "question": question, "options": options})
+                n += 1
+            for _ in range(self.texts):
+                fields.append({"type": "TEXT", "question": TEXT_QUESTIONS[n % len(TEXT_QUESTIONS)]})
+                n += 1
+            steps.append(fields)
+        return steps
+
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Jobs | LinkedIn</title></head>
+<body>
+<small class="jobs-search-results-list__text">__TOTAL__ results</small>
+<div class="scaffold-layout">
+  <div class="jobs-search-results-list">__LIST__</div>
+  <div class="jobs-details"><div class="jobs-details__main-content" id="details"></div></div>
+</div>
+<div id="modal-root"></div>
+<script>
+const JOBS = __JOBS__;
+const FORM = __FORM__;
+const LATENCY = __LATENCY__;
+const esc = (s) => String(s).replace(/[&<>"]/g, (c) => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c]));
+const later = (fn) => setTimeout(fn, LATENCY);
+let current = null;
+let step = 0;
+
+function setUrlJob(id) {
+    const url = new URL(window.location.href);
+    url.searchParams.set("currentJobId", id);
+    history.replaceState(null, "", url.toString());
+}
+
+function selectJob(id) {
+    setUrlJob(id);
+    document.getElementById("details").innerHTML = "";
+    later(() => renderDetails(JOBS[id]));
+}
+
+function renderDetails(job) {
+    current = job;
+    const applied = job.applied
+        ? '<div class="artdeco-inline-feedback"><li-icon class="artdeco-inline-feedback__icon"></li-icon>Applied</div>'
+        : '<button class="jobs-apply-button" onclick="openModal()">Easy Apply</button>';
+    document.getElementById("details").innerHTML = `
+        <div class="jobs-unified-top-card">
+          <span class="job-details-jobs-unified-top-card__job-title-link">${esc(job.title)}</span>
+          <div class="job-details-jobs-unified-top-card__primary-description-without-tagline">${esc(job.company)} · ${esc(job.location)} · ${esc(job.posted)} · ${esc(job.applicants)}</div>
+        </div>
+        ${applied}`;
+}
+
+function renderField(field, i) {
+    const id = `f${step}_${i}`;
+    if (field.type === "FILE") {
+        return `<div class="pb4"><span role="button">Upload resume</span><input type="file">
+            <input type="radio" name="${id}" id="${id}" checked><label for="${id}">resume.pdf</label></div>`;
+    }
+    let control = "";
+    if (field.type === "RADIO") {
+        control = `<fieldset><legend><span aria-hidden="true">${esc(field.question)}</span></legend>` +
+            field.options.map((o, j) => `<div class="fb-text-selectable__option">
+                <input type="radio" name="${id}" id="${id}_${j}" value="${esc(o)}"><label for="${id}_${j}">${esc(o)}</label></div>`).join("") +
+            "</fieldset>";
+    } else if (field.type === "DROPDOWN") {
+        control = `<label for="${id}"><span>${esc(field.question)}</span><span class="visually-hidden">${esc(field.question)}</span></label>
+            <select id="${id}"><option value="Select an option">Select an option</option>` +
+            field.options.map((o) => `<option value="${esc(o)}">${esc(o)}</option>`).join("") + "</select>";
+    } else {
+        control = `<label for="${id}"><span aria-hidden="true">${esc(field.question)}</span></label><input type="text" id="${id}">`;
+    }
+    return `<div class="pb4"><div class="jobs-easy-apply-form-section__grouping">
+        <div class="jobs-easy-apply-form-element">${control}</div></div></div>`;
+}
+
+function renderStep() {
+    const last = step === FORM.length - 1;
+    const review = step >= FORM.length;
+    const progress = review ? 100 : Math.round((100 * step) / (FORM.length + 1)) + 1;
+    const body = review ? "<h3>Review your application</h3>" : FORM[step].map(renderField).join("");
+    const button = review
+        ? '<button class="jobs-apply-form__submit-button" onclick="submitApplication()">Submit application</button>'
+        : `<button aria-label="${last ? "Review your application" : "Continue to next step"}" onclick="nextStep()">Next</button>`;
+    document.getElementById("modal-root").innerHTML = `
+        <div class="artdeco-modal" role="dialog">
+          <button class="artdeco-modal__dismiss" onclick="dismiss()">Dismiss</button>
+          <div class="jobs-easy-apply-content">
+            <progress class="artdeco-completeness-meter-linear__progress-element" value="${progress}" max="100"></progress>
+            ${body}
+            <footer>${button}</footer>
+          </div>
+        </div>`;
+}
+
+function openModal() { step = 0; later(renderStep); }
+function nextStep() { step += 1; later(renderStep); }
+function closeModal() { document.getElementById("modal-root").innerHTML = ""; }
+function submitApplication() { current.applied = true; later(showConfirmation); }
+function showConfirmation() {
+    document.getElementById("modal-root").innerHTML = `
+        <div class="artdeco-modal" role="dialog">
+          <button class="artdeco-modal__dismiss" onclick="closeModal()">Dismiss</button>
+          <h2>Your application was sent</h2>
+        </div>`;
+}
+function dismiss() {
+    document.getElementById("modal-root").insertAdjacentHTML("beforeend", `
+        <div class="artdeco-modal artdeco-modal--confirm"><div class="artdeco-modal__actionbar">
+          <button class="artdeco-modal__confirm-dialog-btn" onclick="closeModal()">Discard</button>
+          <button class="artdeco-modal__confirm-dialog-btn" onclick="closeModal()">Save</button>
+        </div></div>`);
+}
+
+document.querySelectorAll(".scaffold-layout__list-container > li").forEach((li) => {
+    li.addEventListener("click", () => selectJob(li.getAttribute("data-occludable-job-id")));
+});
+const initial = new URL(window.location.href).searchParams.get("currentJobId") || __FIRST__;
+if (initial && JOBS[initial]) selectJob(initial);
+</script>
+</body>
+</html>
+"""
+
+
+def render_card(job):
+    state = '<div class="job-card-container__footer-job-state">Applied</div>' if job["applied"] else ""
+    return (
+        f'<li data-occludable-job-id="{job["id"]}"><div class="job-card-container" data-job-id="{job["id"]}">'
+        f'<a class="job-card-list__title">{html.escape(job["title"])}</a>'
+        f'<div class="job-card-container__primary-description">{html.escape(job["company"])}</div>'
+        f'<div class="job-card-container__metadata-item">{html.escape(job["location"])}</div>'
+        f'<time datetime="{job["listed"]}">{job["posted"]}</time>'
+        f'<div class="job-card-container__footer-item">{job["applicants"]}</div>'
+        f"{state}</div></li>"
+    )
+
+
+def render_search(config, jobs, start):
+    page = jobs[start : start + config.page_size]
+    cards = "".join(render_card(job) for job in page)
+    if page:
+        listing = f'<ul class="scaffold-layout__list-container">{cards}</ul>'
+    else:
+        listing = '<div class="jobs-search-no-results-banner">No matching jobs found.</div>'
+    return (
+        PAGE.replace("__TOTAL__", str(len(jobs)))
+        .replace("__LIST__", listing)
+        .replace("__JOBS__", json.dumps({job["id"]: job for job in jobs}))
+        .replace("__FORM__", json.dumps(config.form()))
+        .replace("__LATENCY__", str(config.latency_ms))
+        .replace("__FIRST__", json.dumps(page[0]["id"] if page else None))
+    )
+
+
+def make_handler(config):
+    jobs = config.jobs()
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.rstrip("/") not in ["/jobs/search", "/login", "/feed"]:
+                self.send_error(404)
+                return
+
+            if url.path.rstrip("/") == "/jobs/search":
+                start = int(parse_qs(url.query).get("start", ["0"])[0])
+                body = render_search(config, jobs, start)
+            else:
+                body = "<!DOCTYPE html><html><head><title>LinkedIn</title></head><body>Feed</body></html>"
+
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def serve(config, host="127.0.0.1", port=0):
+    """Start the fixture site on a background thread and return the server; its URL is server.url."""
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.url = f"http://{host}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_arguments(parser):
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--page-size", type=int, default=25)
+    parser.add_argument("--steps", type=int, default=3, help="Easy Apply form steps before review")
+    parser.add_argument("--radios", type=int, default=1, help="radio groupings per step")
+    parser.add_argument("--dropdowns", type=int, default=1, help="dropdown groupings per step")
+    parser.add_argument("--texts", type=int, default=2, help="text groupings per step")
+    parser.add_argument("--files", type=int, default=1, help="file upload sections on the first step")
+    parser.add_argument("--applied-ratio", type=float, default=0.2, help="share of jobs already applied to")
+    parser.add_argument("--latency-ms", type=int, default=50, help="simulated delay of every page update")
+
+
+def config_from_args(args):
+    return FixtureConfig(
+        pages=args.pages,
+        page_size=args.page_size,
+        steps=args.steps,
+        radios=args.radios,
+        dropdowns=args.dropdowns,
+        texts=args.texts,
+        files=args.files,
+        applied_ratio=args.applied_ratio,
+        latency_ms=args.latency_ms,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = serve(config_from_args(args), port=args.port)
+    print(f"Serving fixture site at {server.url}/jobs/search")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,101 @@
+"""Microbenchmark of JobsPage.fill_form_step against the in-memory fake driver.
+
+Runs synthetic Easy Apply steps through the per-element path, the snapshot path and the
+snapshot path with fill-plan replay, reports steps per second and WebDriver round trips per question, and exits
+non-zero when round trips per question grow past the committed baseline:
+
+    python bench/form_benchmark.py                    # measure and check
+    python bench/form_benchmark.py --update-baseline  # accept the current numbers
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fake_driver import FakeDriver, register_scripts  # noqa: E402
+from fixture_site import FixtureConfig  # noqa: E402
+from pages.Jobs import JobsPage  # noqa: E402
+from providers.answer_providers import JsonAnswerProvider  # noqa: E402
+from utils import AppContext, set_context  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "round_trips_baseline.json")
+
+
+def make_page(mode):
+    context = set_context(AppContext())
+    config = copy.deepcopy(context.config)
+    config["dev"]["snapshot_forms"] = mode != "per_element"
+    config["dev"]["form_plans"] = mode == "replay"
+    config["dev"]["persist_answer_cache"] = False
+    config["dev"]["persist_form_plans"] = False
+    context.config = config
+    # Count records instead of writing them, so disk I/O stays out of the measurement
+    context.record_sink = lambda *args: None
+
+    page = JobsPage(FakeDriver([]), JsonAnswerProvider(context.questions_path))
+    page.current_job = SimpleNamespace(job_id="1", title="", company="", location="", applicants="")
+    return page
+
+
+def measure(mode, steps, iterations):
+    page = make_page(mode)
+    round_trips = questions = 0
+    calls_by_command = {}
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        driver = FakeDriver(steps[i % len(steps)])
+        page.driver = driver
+        page.fill_form_step(i % len(steps) + 1)
+        round_trips += driver.round_trips
+        questions += driver.questions
+        for command, count in driver.calls_by_command.items():
+            calls_by_command[command] = calls_by_command.get(command, 0) + count
+    elapsed = time.perf_counter() - start
+
+    return {
+        "steps_per_second": round(iterations / elapsed, 1),
+        "round_trips_per_step": round(round_trips / iterations, 2),
+        "round_trips_per_question": round(round_trips / questions, 2) if questions else 0,
+        "calls_by_command": dict(sorted(calls_by_command.items())),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--radios", type=int, default=2)
+    parser.add_argument("--dropdowns", type=int, default=2)
+    parser.add_argument("--texts", type=int, default=4)
+    parser.add_argument("--files", type=int, default=1)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    register_scripts()
+    fixture = FixtureConfig(steps=3, radios=args.radios, dropdowns=args.dropdowns, texts=args.texts, files=args.files)
+    steps = fixture.form()
+
+    results = {mode: measure(mode, steps, args.iterations) for mode in ["per_element", "snapshot", "replay"]}
+    print(json.dumps(results, indent=2))
+
+    current = {mode: result["round_trips_per_question"] for mode, result in results.items()}
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w") as file:
+            json.dump(current, file, indent=2)
+            file.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        sys.exit(0)
+
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as file:
+            baseline = json.load(file)
+        regressions = [mode for mode, value in current.items() if value > baseline.get(mode, float("inf"))]
+        for mode in regressions:
+            print(f"Round trips per question regressed for {mode}: {baseline[mode]} -> {current[mode]}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,94 @@
+"""Drive the real JobsPage.apply against the local fixture site in headless Chrome.
+
+Reports jobs per minute and seconds per Easy Apply form step, so that changes to the
+form-filling path can be compared against a stable baseline:
+
+    python bench/run_benchmark.py --pages 2 --steps 3 --output bench_output.json
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from selenium.webdriver import Chrome, ChromeOptions  # noqa: E402
+from fixture_site import add_arguments, config_from_args, serve  # noqa: E402
+from instrumentation import instrumentation  # noqa: E402
+from pages.Base import BasePage  # noqa: E402
+from pages.Jobs import JobsPage  # noqa: E402
+from providers.answer_providers import JsonAnswerProvider  # noqa: E402
+from utils import AppContext, set_context  # noqa: E402
+
+
+def run(args):
+    fixture = config_from_args(args)
+    server = serve(fixture)
+    work_dir = tempfile.mkdtemp(prefix="linkedin-bench-")
+
+    # Real config, but never submit and keep logs and the ledger out of the user's logs_dir
+    context = set_context(AppContext(logs_dir=os.path.join(work_dir, "logs")))
+    config = copy.deepcopy(context.config)
+    config["dev"]["test_mode"] = True
+    config["dev"]["timeout"] = args.timeout * 1000
+    config["dev"]["pipeline_depth"] = args.pipeline_depth
+    # Measure raw throughput; the fixture never throttles
+    config["rate_limit"] = {}
+    context.config = config
+    instrumentation.enabled = True
+
+    options = ChromeOptions()
+    options.add_argument(f"user-data-dir={os.path.join(work_dir, 'profile')}")
+    if not args.headed:
+        options.add_argument("--headless=new")
+    browser = Chrome(options=options)
+
+    BasePage.base_url = server.url
+    try:
+        jobs_page = JobsPage(browser, JsonAnswerProvider(context.questions_path))
+        jobs_page.apply_filters(title="Software Engineer", location="United States")
+
+        start = time.perf_counter()
+        jobs_page.apply()
+        elapsed = time.perf_counter() - start
+    finally:
+        browser.quit()
+        server.shutdown()
+
+    report = instrumentation.report()
+    jobs = report["jobs"]
+    steps = [seconds for job in jobs for phase, seconds in job["phases"] if phase.startswith("form_step_")]
+    result = {
+        "fixture": vars(fixture),
+        "elapsed": round(elapsed, 3),
+        "jobs_listed": fixture.pages * fixture.page_size,
+        "jobs_opened": len(jobs),
+        "jobs_per_minute": round(len(jobs) / elapsed * 60, 2) if elapsed else 0,
+        "form_steps": len(steps),
+        "seconds_per_form_step": round(sum(steps) / len(steps), 4) if steps else None,
+        "wait_stats": BasePage.wait_stats.report(),
+    }
+    if args.include_calls:
+        result["calls"] = report["calls"]
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    parser.add_argument("--timeout", type=float, default=5, help="ceiling for condition based waits, in seconds")
+    parser.add_argument("--pipeline-depth", type=int, default=0, help="jobs loading in background tabs ahead of the form")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--include-calls", action="store_true", help="add per-selector timings to the report")
+    parser.add_argument("--output", help="also write the report to this JSON file")
+    args = parser.parse_args()
+
+    result = run(args)
+    print(json.dumps(result, indent=2))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
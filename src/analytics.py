@@ -0,0 +1,293 @@
+import argparse
+import csv
+import io
+import json
+import os
+import re
+from writers import write_atomic
+
+# Statuses that count as an application going through
+APPLIED = {"APPLIED", "APPLIED_TEST_MODE"}
+
+# Patterns folded out of failure reasons so that the same failure on different jobs groups together
+NOISE = [
+    (re.compile(r"\s*\(Session info:.*", re.DOTALL), ""),
+    (re.compile(r"\s*Stacktrace:.*", re.DOTALL), ""),
+    (re.compile(r"https?://\S+"), "<url>"),
+    (re.compile(r"'[^']*'|\"[^\"]*\""), "<str>"),
+    (re.compile(r"\b0x[0-9a-f]+\b|\b[0-9a-f]{16,}\b"), "<id>"),
+    (re.compile(r"\d+(?:\.\d+)?"), "<n>"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def normalize_reason(reason):
+    """Failure message without the parts that differ per job: stack traces, URLs, quoted values, numbers."""
+    reason = reason or ""
+    for pattern, replacement in NOISE:
+        reason = pattern.sub(replacement, reason)
+    return reason.strip().lower()[:200] or "<none>"
+
+
+class TopCounter:
+    """Counts keys in bounded memory: past 2 x capacity keys, all but the capacity most frequent are dropped.
+
+    The counts of frequent keys stay exact once they are in the top; rare keys may be undercounted.
+    """
+
+    def __init__(self, capacity, counts=None):
+        self.capacity = capacity
+        self.counts = dict(counts or {})
+
+    def add(self, key, count=1):
+        """Count key; returns the keys dropped to stay within bounds."""
+        self.counts[key] = self.counts.get(key, 0) + count
+        if len(self.counts) <= 2 * self.capacity:
+            return []
+        ranked = sorted(self.counts.items(), key=lambda item: -item[1])
+        self.counts = dict(ranked[: self.capacity])
+        return [key for key, _ in ranked[self.capacity :]]
+
+    def top(self, n):
+        return sorted(self.counts.items(), key=lambda item: -item[1])[:n]
+
+
+def csv_records(path, offset=0):
+    """Yield (row, end_offset) for every complete CSV record from offset on.
+
+    Reads line by line in binary, so the offset of each record is known; a record spans lines
+    while its quotes are unbalanced, and a last record without its newline is left for next time.
+    """
+    with open(path, "rb") as file:
+        file.seek(offset)
+        pending = b""
+        while True:
+            line = file.readline()
+            if not line or not line.endswith(b"\n"):
+                return
+            pending += line
+            if pending.count(b'"') % 2:
+                continue
+            text = pending.decode("utf-8", errors="replace")
+            pending = b""
+            row = next(csv.reader(io.StringIO(text, newline="")), None)
+            if row:
+                yield row, file.tell()
+
+
+def json_array_items(path, chunk_size=1 << 16):
+    """Yield the items of a top-level JSON array one at a time, reading chunk_size characters at once."""
+    decoder = json.JSONDecoder()
+    with open(path, "r") as file:
+        buffer = ""
+        position = 0
+        started = False
+        while True:
+            chunk = file.read(chunk_size)
+            buffer = buffer[position:] + chunk
+            position = 0
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if not started:
+                    if position < len(buffer) and buffer[position] == "[":
+                        started = True
+                        position += 1
+                        continue
+                    break
+                if position < len(buffer) and buffer[position] == "]":
+                    return
+                try:
+                    item, position = decoder.raw_decode(buffer, position)
+                except ValueError:
+                    break
+                yield item
+            if not chunk:
+                return
+
+
+class LogAnalytics:
+    """One streaming pass over the run logs, folded into bounded summaries.
+
+    answered_questions.csv and application_status.csv are read from the byte offsets reached last
+    time when a state file is used, so only rows written since are processed; a log that shrank or
+    was replaced is read again from the start. The unprepared questions log already holds one
+    counted entry per distinct question, and is rewritten when compacted, so it is read whole.
+    """
+
+    def __init__(self, logs_dir, state_path=None, capacity=1000, max_answers=20):
+        self.logs_dir = logs_dir
+        self.state_path = state_path
+        self.capacity = capacity
+        self.max_answers = max_answers
+        self.offsets = {}
+        self.days = {}
+        self.failures = TopCounter(capacity)
+        self.questions = TopCounter(capacity)
+        self.answers = {}
+        self.unprepared = TopCounter(capacity)
+        self.rows = 0
+
+    def load(self):
+        if not self.state_path:
+            return
+        try:
+            with open(self.state_path, "r") as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return
+        self.offsets = state["offsets"]
+        self.days = state["days"]
+        self.failures = TopCounter(self.capacity, {tuple(key): count for key, count in state["failures"]})
+        self.questions = TopCounter(self.capacity, {tuple(key): count for key, count in state["questions"]})
+        for question, type, values in state["answers"]:
+            self.answers[(question, type)] = TopCounter(self.max_answers, dict(values))
+
+    def save(self):
+        if not self.state_path:
+            return
+        state = {
+            "offsets": self.offsets,
+            "days": self.days,
+            "failures": [[list(key), count] for key, count in self.failures.counts.items()],
+            "questions": [[list(key), count] for key, count in self.questions.counts.items()],
+            "answers": [
+                [question, type, list(values.counts.items())] for (question, type), values in self.answers.items()
+            ],
+        }
+        write_atomic(self.state_path, lambda file: json.dump(state, file))
+
+    def read_csv(self, name, handle, reset):
+        """Feed each new row of a CSV log to handle as a dict, calling reset first if the log starts over."""
+        path = os.path.join(self.logs_dir, name)
+        if not os.path.exists(path):
+            return
+        stat = os.stat(path)
+        saved = self.offsets.get(name)
+        if saved is None or saved["inode"] != stat.st_ino or saved["offset"] > stat.st_size:
+            if saved is not None:
+                reset()
+            saved = {"inode": stat.st_ino, "offset": 0, "header": None}
+            self.offsets[name] = saved
+
+        for row, offset in csv_records(path, saved["offset"]):
+            saved["offset"] = offset
+            if saved["header"] is None:
+                saved["header"] = row
+                continue
+            handle(dict(zip(saved["header"], row)))
+            self.rows += 1
+
+    def add_status(self, row):
+        status = row.get("STATUS", "")
+        day = self.days.setdefault(row.get("APPLICATION_DATE", ""), {})
+        day[status] = day.get(status, 0) + 1
+        if status not in APPLIED and status != "ALREADY_APPLIED":
+            self.failures.add((status, normalize_reason(row.get("REASON"))))
+
+    def reset_statuses(self):
+        self.days = {}
+        self.failures = TopCounter(self.capacity)
+
+    def add_answer(self, row):
+        key = (row.get("QUESTION", ""), row.get("TYPE", ""))
+        for dropped in self.questions.add(key):
+            self.answers.pop(dropped, None)
+        if key in self.questions.counts:
+            self.answers.setdefault(key, TopCounter(self.max_answers)).add(row.get("ANSWER", ""))
+
+    def reset_answers(self):
+        self.questions = TopCounter(self.capacity)
+        self.answers = {}
+
+    def unprepared_entries(self):
+        path = os.path.join(self.logs_dir, "unprepared_questions.jsonl")
+        if os.path.exists(path):
+            with open(path, "r") as file:
+                for line in file:
+                    if line.strip():
+                        yield json.loads(line)
+            return
+        path = os.path.join(self.logs_dir, "unprepared_questions.json")
+        if os.path.exists(path):
+            yield from json_array_items(path)
+
+    def add_unprepared(self, data):
+        options = data.get("options")
+        key = (data["question"], data["type"], json.dumps(options) if options is not None else None)
+        self.unprepared.add(key, data.get("count", 1))
+
+    def run(self):
+        self.load()
+        self.read_csv("application_status.csv", self.add_status, self.reset_statuses)
+        self.read_csv("answered_questions.csv", self.add_answer, self.reset_answers)
+        for data in self.unprepared_entries():
+            self.add_unprepared(data)
+        self.save()
+        return self
+
+    def report(self, top=20):
+        answers = []
+        for (question, type), count in self.questions.top(top):
+            values = self.answers.get((question, type))
+            answers.append(
+                {"question": question, "type": type, "count": count, "answers": values.top(top) if values else []}
+            )
+        return {
+            "new_rows": self.rows,
+            "unprepared_questions": [
+                {"question": question, "type": type, "options": json.loads(options) if options else None, "count": n}
+                for (question, type, options), n in self.unprepared.top(top)
+            ],
+            "failure_reasons": [
+                {"status": status, "reason": reason, "count": count}
+                for (status, reason), count in self.failures.top(top)
+            ],
+            "applications_per_day": dict(sorted(self.days.items())),
+            "answers": answers,
+        }
+
+
+def print_report(report):
+    print(f"Processed {report['new_rows']} new rows")
+
+    print("\nTop unprepared questions:")
+    for entry in report["unprepared_questions"]:
+        options = f" {entry['options']}" if entry["options"] else ""
+        print(f"  {entry['count']:>6}  [{entry['type']}] {entry['question']}{options}")
+
+    print("\nFailure reasons:")
+    for entry in report["failure_reasons"]:
+        print(f"  {entry['count']:>6}  {entry['status']}: {entry['reason']}")
+
+    print("\nApplications per day:")
+    for day, statuses in report["applications_per_day"].items():
+        counts = ", ".join(f"{status} {count}" for status, count in sorted(statuses.items()))
+        print(f"  {day}  {counts}")
+
+    print("\nAnswers:")
+    for entry in report["answers"]:
+        print(f"  {entry['count']:>6}  [{entry['type']}] {entry['question']}")
+        for answer, count in entry["answers"]:
+            print(f"  {count:>14}  {answer}")
+
+
+if __name__ == "__main__":
+    # Usage: python src/analytics.py [logs_dir] [--incremental] [--top N] [--json]
+    parser = argparse.ArgumentParser(description="Summarize the run logs in one streaming pass.")
+    parser.add_argument("logs_dir", nargs="?", default="logs")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="keep offsets and totals in <logs_dir>/analytics_state.json and only read rows added since last time",
+    )
+    parser.add_argument("--top", type=int, default=20, help="entries shown per section")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    state_path = os.path.join(args.logs_dir, "analytics_state.json") if args.incremental else None
+    report = LogAnalytics(args.logs_dir, state_path).run().report(args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
@@ -0,0 +1,101 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+import urllib.request
+from selenium.webdriver import ChromeOptions, Chrome
+from utils import get_context
+
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+
+def browser_config():
+    return get_context().config.get("browser") or {}
+
+
+def debugger_reachable(address, timeout=0.5):
+    try:
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def find_chrome():
+    binary = browser_config().get("chrome_binary")
+    if binary:
+        return binary
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise FileNotFoundError("Chrome not found; set browser.chrome_binary in config.yaml")
+
+
+def start_daemon(address, profile_dir="userData", timeout=15):
+    """Launch a detached Chrome listening on address, which later runs attach to instead of starting their own."""
+    if debugger_reachable(address):
+        return
+    profile_dir = os.path.abspath(profile_dir)
+    os.makedirs(profile_dir, exist_ok=True)
+    port = address.rsplit(":", 1)[-1]
+    args = [find_chrome(), f"--remote-debugging-port={port}", f"--user-data-dir={profile_dir}"]
+    args += get_context().config["dev"]["args"]
+    subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+    deadline = time.monotonic() + timeout
+    while not debugger_reachable(address):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Chrome did not start listening on {address}")
+        time.sleep(0.2)
+
+
+def create_browser(profile_dir="userData", attach=True):
+    """Start Chrome with the configured arguments on the given user-data-dir profile.
+
+    With browser.debugger_address set (and attach on), connect to the Chrome already listening
+    there instead, starting it first when browser.daemon is on.
+    """
+    config = get_context().config
+    address = browser_config().get("debugger_address")
+    if attach and address:
+        if browser_config().get("daemon"):
+            start_daemon(address, profile_dir)
+        if debugger_reachable(address):
+            options = ChromeOptions()
+            options.add_experimental_option("debuggerAddress", address)
+            browser = Chrome(options=options)
+            browser.attached = True
+            print(f"Attached to browser at {address}")
+            return browser
+        print(f"No browser listening on {address}. Starting a new one.")
+
+    profile_dir = os.path.abspath(profile_dir)
+    os.makedirs(profile_dir, exist_ok=True)
+
+    options = ChromeOptions()
+    options.add_argument(f"user-data-dir={profile_dir}")
+    for argument in config["dev"]["args"]:
+        options.add_argument(argument)
+    if config["dev"]["headless"]:
+        options.add_argument("--headless=new")
+
+    browser = Chrome(options=options)
+    browser.attached = False
+    return browser
+
+
+def close_browser(browser):
+    """End the run: leave attached browsers running, quit launched ones unless browser.quit_on_exit is off."""
+    if getattr(browser, "attached", False):
+        browser.service.stop()
+    elif browser_config().get("quit_on_exit", True):
+        browser.quit()
+
+
+if __name__ == "__main__":
+    # Usage: python src/browser.py [address]  -- start the long-lived browser daemon
+    address = sys.argv[1] if len(sys.argv) > 1 else browser_config().get("debugger_address") or "127.0.0.1:9222"
+    start_daemon(address)
+    print(f"Browser listening on {address}")
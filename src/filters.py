@@ -0,0 +1,86 @@
+import re
+from job_queue import applicant_count
+
+# Points at which a job is checked, in order
+STAGES = ["card", "details"]
+
+
+def any_of(patterns, escape=False):
+    """One case-insensitive regex matching any of the patterns, or None for an empty list."""
+    patterns = [re.escape(pattern) if escape else pattern for pattern in patterns or [] if pattern]
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE) if patterns else None
+
+
+class JobFilter:
+    """Rules from the filters section of config.yaml, compiled once and checked before applying.
+
+    Each rule only rejects on data it has: a card without an applicant count passes
+    max_applicants, and is checked again against the job details before Easy Apply.
+    """
+
+    def __init__(self, companies=None, title_excludes=None, title_includes=None, max_applicants=None, locations=None):
+        self.rules = []
+
+        companies = {company.strip().lower() for company in companies or []}
+        if companies:
+            self.rules.append(("companies", lambda job: self.blacklisted(companies, job.company)))
+
+        excluded = any_of(title_excludes)
+        if excluded:
+            self.rules.append(("title_excludes", lambda job: self.title_excluded(excluded, job.title)))
+
+        included = any_of(title_includes)
+        if included:
+            self.rules.append(("title_includes", lambda job: self.not_matching(included, job.title, "title")))
+
+        if max_applicants is not None:
+            self.rules.append(("max_applicants", lambda job: self.too_many_applicants(max_applicants, job.applicants)))
+
+        allowed = any_of(locations, escape=True)
+        if allowed:
+            self.rules.append(("locations", lambda job: self.not_matching(allowed, job.location, "location")))
+
+        # Counted per stage: result cards, then the details of the jobs that passed as cards
+        self.hits = {stage: {name: 0 for name, _ in self.rules} for stage in STAGES}
+        self.checked = {stage: 0 for stage in STAGES}
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**(config.get("filters") or {}))
+
+    @staticmethod
+    def blacklisted(companies, company):
+        return "company is blacklisted" if company and company.strip().lower() in companies else None
+
+    @staticmethod
+    def not_matching(allowed, value, field):
+        return f"{field} '{value}' not allowed" if value and not allowed.search(value) else None
+
+    @staticmethod
+    def title_excluded(excluded, title):
+        match = excluded.search(title or "")
+        return f"title contains '{match.group()}'" if match else None
+
+    @staticmethod
+    def too_many_applicants(max_applicants, applicants):
+        count = applicant_count(applicants)
+        if count is None or count <= max_applicants:
+            return None
+        return f"{applicants.strip()} (limit {max_applicants})"
+
+    def check(self, job, stage="card"):
+        """Return the reason the job should be skipped, or None to apply to it.
+
+        stage is "card" for a search result or "details" for an opened job, which has the data a
+        card may lack; a job that passed as a card is checked again on its details.
+        """
+        self.checked[stage] += 1
+        for name, rule in self.rules:
+            reason = rule(job)
+            if reason:
+                self.hits[stage][name] += 1
+                return f"Filtered by {name}: {reason}"
+        return None
+
+    def report(self):
+        return {stage: {"checked": self.checked[stage], "hits": dict(self.hits[stage])} for stage in STAGES}
@@ -0,0 +1,133 @@
+import csv
+import json
+import os
+import time
+from bisect import bisect_left
+
+# Upper bounds in seconds of the latency histogram buckets; the last bucket catches everything slower
+BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+
+
+class Timing:
+    __slots__ = ["count", "total", "max", "histogram"]
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(BUCKETS) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.histogram[bisect_left(BUCKETS, seconds)] += 1
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total": round(self.total, 4),
+            "mean": round(self.total / self.count, 4) if self.count else 0,
+            "max": round(self.max, 4),
+            "histogram": dict(zip([str(b) for b in BUCKETS] + ["inf"], self.histogram)),
+        }
+
+
+class Timer:
+    """Times a with-block into a Timing; a plain class because it runs around every WebDriver call."""
+
+    __slots__ = ["timing", "start"]
+
+    def __init__(self, timing):
+        self.timing = timing
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timing.add(time.perf_counter() - self.start)
+        return False
+
+
+class NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+null_timer = NullTimer()
+
+
+class Instrumentation:
+    """Per-selector call timings and per-job phase breakdowns for one process."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.calls = {}
+        self.jobs = []
+        self.current_job = None
+
+    def timer(self, method, selector=None):
+        if not self.enabled:
+            return null_timer
+        key = (method, selector)
+        timing = self.calls.get(key)
+        if timing is None:
+            timing = self.calls[key] = Timing()
+        return Timer(timing)
+
+    def start_job(self, job_id):
+        self.end_job()
+        now = time.perf_counter()
+        self.current_job = {"job_id": job_id, "started": now, "last_mark": now, "phases": []}
+
+    def mark(self, phase):
+        """Close the current phase of the job: it covers the time since the previous mark."""
+        job = self.current_job
+        if job is None or not self.enabled:
+            return
+        now = time.perf_counter()
+        job["phases"].append((phase, round(now - job["last_mark"], 4)))
+        job["last_mark"] = now
+
+    def end_job(self):
+        if self.current_job is None:
+            return
+        job = self.current_job
+        job["total"] = round(time.perf_counter() - job.pop("started"), 4)
+        del job["last_mark"]
+        self.jobs.append(job)
+        self.current_job = None
+
+    def report(self):
+        self.end_job()
+        return {
+            "calls": [
+                {"method": method, "selector": selector, **timing.to_dict()}
+                for (method, selector), timing in sorted(self.calls.items(), key=lambda item: -item[1].total)
+            ],
+            "jobs": self.jobs,
+        }
+
+    def write_report(self, logs_dir, name="instrumentation"):
+        """Write <name>.json with everything and <name>_jobs.csv with one row per job phase."""
+        if not self.enabled:
+            return
+        report = self.report()
+        with open(os.path.join(logs_dir, f"{name}.json"), "w") as file:
+            json.dump(report, file, indent=2)
+        with open(os.path.join(logs_dir, f"{name}_jobs.csv"), "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["JOB_ID", "PHASE", "SECONDS"])
+            for job in report["jobs"]:
+                for phase, seconds in job["phases"]:
+                    writer.writerow([job["job_id"], phase, seconds])
+                writer.writerow([job["job_id"], "total", job["total"]])
+
+
+# Shared by every page in this process
+instrumentation = Instrumentation()
@@ -0,0 +1,87 @@
+import heapq
+import itertools
+import re
+from datetime import datetime
+
+# Orderings usable in queue.priority, most important first
+PRIORITIES = ["keyword_match", "fewest_applicants", "most_recent"]
+
+
+def applicant_count(text):
+    """Applicant count shown on a card ("Over 200 applicants", "Be an early applicant"), or None.
+
+    "Over N" counts as N + 1, so that a limit of N rejects it.
+    """
+    if not text:
+        return None
+    if "early applicant" in text.lower():
+        return 0
+    match = re.search(r"(over\s+)?(\d[\d,]*)", text, re.IGNORECASE)
+    if not match:
+        return None
+    count = int(match.group(2).replace(",", ""))
+    return count + 1 if match.group(1) else count
+
+
+def posted_timestamp(text):
+    """Timestamp of a card's ISO listing date, or None."""
+    try:
+        return datetime.fromisoformat(text).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class JobQueue:
+    """Pending jobs from any number of searches, each job once, handed out best first.
+
+    Jobs are ordered by the priority list: titles matching more of the keywords, fewer
+    applicants, more recently posted. Jobs with unknown values go after the known ones, and
+    ties keep the order they were discovered in.
+    """
+
+    def __init__(self, priority=None, keywords=None):
+        priority = list(priority) if priority is not None else PRIORITIES
+        unknown = [name for name in priority if name not in PRIORITIES]
+        if unknown:
+            raise ValueError(f"Unknown queue priority {unknown}; expected any of {PRIORITIES}")
+        self.priority = priority
+        words = [re.escape(keyword.lower()) for keyword in keywords or [] if keyword]
+        self.keywords = [re.compile(rf"\b{word}\b") for word in words]
+        self.heap = []
+        self.seen = set()
+        self.order = itertools.count()
+        self.duplicates = 0
+
+    def sort_key(self, card):
+        key = []
+        for name in self.priority:
+            if name == "keyword_match":
+                title = card.title.lower()
+                key.append(-sum(1 for keyword in self.keywords if keyword.search(title)))
+            elif name == "fewest_applicants":
+                count = applicant_count(card.applicants)
+                key.append(count if count is not None else float("inf"))
+            elif name == "most_recent":
+                timestamp = posted_timestamp(card.posted)
+                key.append(-timestamp if timestamp is not None else float("inf"))
+        return key
+
+    def push(self, card):
+        """Queue a card unless its job is already queued or was handed out; returns whether it was new."""
+        if card.job_id in self.seen:
+            self.duplicates += 1
+            return False
+        self.seen.add(card.job_id)
+        heapq.heappush(self.heap, (self.sort_key(card), next(self.order), card))
+        return True
+
+    def pop(self):
+        return heapq.heappop(self.heap)[2] if self.heap else None
+
+    def __len__(self):
+        return len(self.heap)
+
+    def job_ids(self):
+        """Yield job ids best first, emptying the queue."""
+        while self.heap:
+            yield self.pop().job_id
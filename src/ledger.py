@@ -0,0 +1,146 @@
+import csv
+import json
+import os
+import sqlite3
+import sys
+
+# Statuses that mean a job needs no further work
+DONE_STATUSES = ("APPLIED", "ALREADY_APPLIED")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY,
+    application_date TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    job_role TEXT,
+    company TEXT,
+    location TEXT,
+    applicants TEXT,
+    status TEXT NOT NULL,
+    reason TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_applications_job_id ON applications (job_id);
+CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status);
+CREATE INDEX IF NOT EXISTS idx_applications_date ON applications (application_date);
+
+CREATE TABLE IF NOT EXISTS answered_questions (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    question TEXT NOT NULL,
+    type TEXT NOT NULL,
+    answer TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_answered_questions_job_id ON answered_questions (job_id);
+
+CREATE TABLE IF NOT EXISTS unprepared_questions (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT,
+    question TEXT NOT NULL,
+    type TEXT NOT NULL,
+    options TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_unprepared_questions_question ON unprepared_questions (question, type);
+"""
+
+
+class ApplicationLedger:
+    """Embedded SQLite record of every job handled, queryable by job id before a card is opened."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def record_application(self, date, job_id, job_role, company, location, applicants, status, reason=None):
+        # Commit per job; answers recorded during the job share this transaction
+        self.conn.execute(
+            "INSERT INTO applications (application_date, job_id, job_role, company, location, applicants, status, reason)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (date, job_id, job_role, company, location, applicants, status, reason or ""),
+        )
+        self.conn.commit()
+
+    def record_answer(self, job_id, question, type, answer):
+        self.conn.execute(
+            "INSERT INTO answered_questions (job_id, question, type, answer) VALUES (?, ?, ?, ?)",
+            (job_id, question, type, None if answer is None else str(answer)),
+        )
+
+    def record_unprepared(self, job_id, question, type, options=None):
+        self.conn.execute(
+            "INSERT INTO unprepared_questions (job_id, question, type, options) VALUES (?, ?, ?, ?)",
+            (job_id, question, type, None if options is None else json.dumps(options)),
+        )
+
+    def known_job_ids(self, job_ids, statuses=DONE_STATUSES):
+        """Return the subset of job_ids that already have one of the given statuses."""
+        job_ids = [str(job_id) for job_id in job_ids if job_id]
+        known = set()
+        # SQLite caps the number of bound parameters per statement
+        for i in range(0, len(job_ids), 500):
+            chunk = job_ids[i : i + 500]
+            query = "SELECT DISTINCT job_id FROM applications WHERE job_id IN ({}) AND status IN ({})".format(
+                ",".join("?" * len(chunk)), ",".join("?" * len(statuses))
+            )
+            known.update(row[0] for row in self.conn.execute(query, (*chunk, *statuses)))
+        return known
+
+    def is_known(self, job_id, statuses=DONE_STATUSES):
+        return bool(self.known_job_ids([job_id], statuses))
+
+    def is_empty(self, table):
+        return self.conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is None
+
+    def import_csv_logs(self, logs_dir):
+        """Load application_status.csv and answered_questions.csv, skipping tables that already hold rows."""
+        imported = 0
+        status_path = os.path.join(logs_dir, "application_status.csv")
+        if os.path.exists(status_path) and self.is_empty("applications"):
+            with open(status_path, newline="") as file:
+                rows = [
+                    (
+                        row["APPLICATION_DATE"],
+                        row["JOB_ID"],
+                        row["JOB_ROLE"],
+                        row["COMPANY"],
+                        row["LOCATION"],
+                        row["APPLICANTS"],
+                        row["STATUS"],
+                        row["REASON"],
+                    )
+                    for row in csv.DictReader(file)
+                ]
+            self.conn.executemany(
+                "INSERT INTO applications (application_date, job_id, job_role, company, location, applicants, status, reason)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            imported += len(rows)
+
+        answers_path = os.path.join(logs_dir, "answered_questions.csv")
+        if os.path.exists(answers_path) and self.is_empty("answered_questions"):
+            with open(answers_path, newline="") as file:
+                rows = [(row["JOB_ID"], row["QUESTION"], row["TYPE"], row["ANSWER"]) for row in csv.DictReader(file)]
+            self.conn.executemany(
+                "INSERT INTO answered_questions (job_id, question, type, answer) VALUES (?, ?, ?, ?)", rows
+            )
+            imported += len(rows)
+
+        self.conn.commit()
+        return imported
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    # Usage: python src/ledger.py <logs_dir> [db_path]
+    logs_dir = sys.argv[1] if len(sys.argv) > 1 else "logs"
+    db_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(logs_dir, "ledger.db")
+    ledger = ApplicationLedger(db_path)
+    print(f"Imported {ledger.import_csv_logs(logs_dir)} rows into {db_path}")
+    ledger.close()
@@ -1,42 +1,100 @@
-import os
-from selenium.webdriver import ChromeOptions, Chrome
+import argparse
+import sys
+from browser import create_browser, close_browser
 from pages.Jobs import JobsPage
 from pages.Login import LoginPage
+from pages.Base import BasePage
 from providers.answer_providers import JsonAnswerProvider
-from utils import config
+from pool import run_pool
+from supervisor import BrowserSupervisor
+from instrumentation import instrumentation
+from utils import AppContext, set_context
 
 
-os.makedirs("userData", exist_ok=True)
+def main():
+    parser = argparse.ArgumentParser(description="Apply to LinkedIn Easy Apply jobs.")
+    parser.add_argument(
+        "--jobs",
+        metavar="FILE",
+        help="apply to the job ids or URLs listed in FILE, one per line ('-' for stdin), instead of searching",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue an interrupted search run from its last checkpoint instead of the first result",
+    )
+    args = parser.parse_args()
 
-options = ChromeOptions()
-options.add_argument(f"user-data-dir={os.getcwd()}/userData")
-for argument in config["dev"]["args"]:
-    options.add_argument(argument)
+    context = set_context(AppContext())
+    config = context.config
+    instrumentation.enabled = config["dev"].get("instrumentation", True)
+    workers = config.get("pool", {}).get("workers", 1)
 
+    # Only a single search applied to in this process keeps a checkpoint
+    if args.resume:
+        if args.jobs:
+            parser.error("--resume only applies to search runs, not --jobs")
+        if isinstance(config["search"], list) and len(config["search"]) > 1:
+            parser.error("--resume is not supported with several searches")
+        if workers > 1:
+            parser.error("--resume is not supported with pool.workers above 1")
 
-browser = Chrome(options=options)
+    browser = create_browser("userData")
 
-# Login to LinkedIn
-login_page = LoginPage(browser)
-login_page.login(username=config["credentials"]["email"], password=config["credentials"]["password"])
+    # Login to LinkedIn
+    login_page = LoginPage(browser)
+    login_page.login(username=config["credentials"]["email"], password=config["credentials"]["password"])
 
+    # Answer Provider
+    answer_provider = JsonAnswerProvider(context.questions_path)
 
-# Answer Provider
-file_path = os.path.join(os.path.dirname(__file__), "..", "questions.json")
-answer_provider = JsonAnswerProvider(file_path)
+    jobs_page = JobsPage(browser, answer_provider)
+    if config.get("recycle"):
+        jobs_page.supervisor = BrowserSupervisor(
+            jobs_page, "userData", config["credentials"], settings=config["recycle"]
+        )
 
+    if args.jobs:
+        # Job Queue
+        lines = sys.stdin if args.jobs == "-" else open(args.jobs, "r")
+        with lines:
+            if workers > 1:
+                run_pool(jobs_page, workers, jobs_page.queued_jobs(lines))
+            else:
+                jobs_page.apply_queue(lines)
+    else:
+        searches = config["search"] if isinstance(config["search"], list) else [config["search"]]
+        queue_config = config.get("queue") or {}
 
-# Job Search
-jobs_page = JobsPage(browser, answer_provider)
-jobs_page.apply_filters(
-    title=config["search"]["keyword"],
-    location=config["search"]["location"],
-    work_location=config["search"]["work_location"],
-    job_type=config["search"]["job_type"],
-    experience_level=config["search"]["experience_level"],
-)
-jobs_page.apply()
+        if len(searches) > 1:
+            # Job Searches, merged into one queue
+            priority, keywords = queue_config.get("priority"), queue_config.get("keywords")
+            if workers > 1:
+                run_pool(jobs_page, workers, jobs_page.search_all(searches, priority, keywords).job_ids())
+            else:
+                jobs_page.apply_searches(searches, priority, keywords)
+        else:
+            # Job Search
+            jobs_page.apply_filters(**JobsPage.filters_from_config(searches[0]), resume=args.resume)
 
+            if workers > 1:
+                run_pool(jobs_page, workers)
+            else:
+                jobs_page.apply()
+    print("Wait stats:", BasePage.wait_stats.report())
+    print("Answer cache:", jobs_page.resolutions.stats())
+    print("Form plans:", jobs_page.form_plans.report())
+    print("Rate limiting:", context.scheduler.report())
+    print("Filters:", context.job_filter.report())
+    instrumentation.write_report(context.logs_dir)
 
-input("Press Enter to continue...")
-browser.quit()
+    if config.get("browser", {}).get("wait_for_enter", True):
+        input("Press Enter to continue...")
+    if jobs_page.supervisor is not None:
+        jobs_page.supervisor.close()
+    else:
+        close_browser(jobs_page.driver)
+
+
+if __name__ == "__main__":
+    main()
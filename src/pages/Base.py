@@ -3,44 +3,130 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException
+from urllib.parse import urlparse, parse_qs
+from contextlib import contextmanager
+from utils import get_context
+from instrumentation import instrumentation
 import time
 
 
+class WaitStats:
+    """Splits wall time since start into time spent waiting on the page and time spent working."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.waiting = 0.0
+        self.waits = 0
+
+    def add(self, seconds):
+        self.waiting += seconds
+        self.waits += 1
+
+    def report(self):
+        elapsed = time.monotonic() - self.started
+        return {
+            "elapsed": round(elapsed, 3),
+            "waiting": round(self.waiting, 3),
+            "working": round(elapsed - self.waiting, 3),
+            "waits": self.waits,
+        }
+
+
 class BasePage:
     base_url = "https://www.linkedin.com"
 
+    # Shared by every page so the report covers the whole run
+    wait_stats = WaitStats()
+    instrumentation = instrumentation
+
     def __init__(self, driver: webdriver.Chrome):
         self.driver = driver
 
+        # Ceiling and poll interval for condition based waits
+        config = get_context().config
+        self.timeout = config["dev"]["timeout"] / 1000
+        self.poll_interval = config["dev"].get("poll_interval", 0.1)
+
+    @contextmanager
+    def timed_wait(self):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.wait_stats.add(time.monotonic() - start)
+
     def wait(self, seconds):
-        time.sleep(seconds)
+        with self.instrumentation.timer("wait", seconds), self.timed_wait():
+            time.sleep(seconds)
 
     def find_element(self, el=None, by=By.CSS_SELECTOR, value=None, fail=True):
         func = self.driver.find_element if el is None else el.find_element
-        try:
-            return func(by, value)
-        except Exception as e:
-            if fail:
-                raise e
-            return None
+        with self.instrumentation.timer("find_element", value):
+            try:
+                return func(by, value)
+            except Exception as e:
+                if fail:
+                    raise e
+                return None
 
     def find_elements(self, el=None, by=By.CSS_SELECTOR, value=None, fail=True):
         func = self.driver.find_elements if el is None else el.find_elements
-        try:
-            return func(by, value)
-        except Exception as e:
-            if fail:
-                raise e
-            return []
+        with self.instrumentation.timer("find_elements", value):
+            try:
+                return func(by, value)
+            except Exception as e:
+                if fail:
+                    raise e
+                return []
+
+    def wait_until(self, condition, timeout=None, poll_interval=None, fail=True):
+        """Poll condition(driver) until it returns a truthy value, capped at dev.timeout."""
+        wait = WebDriverWait(
+            self.driver,
+            timeout or self.timeout,
+            poll_frequency=poll_interval or self.poll_interval,
+            ignored_exceptions=[StaleElementReferenceException],
+        )
+        with self.timed_wait():
+            try:
+                return wait.until(condition)
+            except Exception as e:
+                if fail:
+                    raise e
+                return None
 
     def wait_for_selector(self, by: By, value: str, timeout=10, fail=True):
-        try:
-            element = WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((by, value)))
-            return element
-        except Exception as e:
-            if fail:
-                raise e
-            return None
+        with self.instrumentation.timer("wait_for_selector", value):
+            return self.wait_until(EC.presence_of_element_located((by, value)), timeout=timeout, fail=fail)
+
+    def wait_for_page_load(self, timeout=None, poll_interval=None, fail=True):
+        return self.wait_until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete",
+            timeout=timeout,
+            poll_interval=poll_interval,
+            fail=fail,
+        )
+
+    def wait_for_url_param(self, name: str, value: str, timeout=None, poll_interval=None, fail=True):
+        """Wait until the current URL carries the given query parameter value."""
+
+        def condition(driver):
+            return value in parse_qs(urlparse(driver.current_url).query).get(name, [])
+
+        return self.wait_until(condition, timeout=timeout, poll_interval=poll_interval, fail=fail)
+
+    def wait_for_url_change(self, url: str, timeout=None, poll_interval=None, fail=True):
+        return self.wait_until(EC.url_changes(url), timeout=timeout, poll_interval=poll_interval, fail=fail)
+
+    def wait_for_detached(self, by: By, value: str, timeout=None, poll_interval=None, fail=True):
+        """Wait until no element matches the selector, or the match is hidden."""
+        return self.wait_until(
+            EC.invisibility_of_element_located((by, value)),
+            timeout=timeout,
+            poll_interval=poll_interval,
+            fail=fail,
+        )
 
     def wait_and_type(self, by: By, value: str, text: str) -> WebElement:
         element = self.wait_for_selector(by, value)
@@ -48,6 +134,7 @@ class BasePage:
         return element
 
     def wait_and_click(self, by: By, value: str) -> WebElement:
-        element = self.wait_for_selector(by, value)
-        element.click()
-        return element
+        with self.instrumentation.timer("wait_and_click", value):
+            element = self.wait_for_selector(by, value)
+            element.click()
+            return element
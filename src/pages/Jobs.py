@@ -1,10 +1,19 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
 from .Base import BasePage
+from .Login import LoginPage
+from .scripts import SNAPSHOT_FORM, APPLY_FORM, REPLAY_FORM, JOB_CARDS, JOB_SUMMARY
+import re
+from collections import deque
 from urllib.parse import urlencode, urlparse, parse_qs
-from providers.answer_providers import AnswerProvider
+from functools import cached_property
+from providers.answer_providers import AnswerProvider, normalize_question
+from providers.resolution_cache import ResolutionCache
+from providers.form_plans import FormPlanCache
+from job_queue import JobQueue
 from utils import (
-    config,
+    get_context,
     record_answered_question,
     record_unprepared_question,
     record_application_status,
@@ -50,6 +59,68 @@ class JobDetails:
         )
 
 
+class JobCard:
+    """A search result read from the list without opening it."""
+
+    def __init__(
+        self,
+        index: int,
+        job_id: str,
+        title: str,
+        company: str,
+        location: str,
+        applied: bool,
+        posted: str = "",
+        applicants: str = "",
+    ) -> None:
+        self.index = index
+        self.job_id = job_id
+        self.title = title
+        self.company = company
+        self.location = location
+        self.applied = applied
+        self.posted = posted
+        self.applicants = applicants
+        self.offset = index - 1
+        # Whether the ledger already has a final status for the job, set per page by job_stream
+        self.known = False
+
+
+RESULTS_LIST = ".jobs-search-results-list > ul.scaffold-layout__list-container"
+# Shown instead of the list past the last result
+NO_RESULTS = ".jobs-search-no-results-banner"
+
+# Where LinkedIn sends a session it does not accept, even when its cookie still looks valid
+LOGIN_WALL = ["/login", "/uas/login", "/authwall", "/checkpoint/"]
+
+# Where LinkedIn sends sessions it is rate limiting or wants to verify
+THROTTLE_MARKERS = ["/checkpoint/", "/authwall", "too-many-requests"]
+
+
+class PrefetchedJob:
+    """A job loading in its own tab ahead of the apply stage; details are filled in once it has loaded."""
+
+    def __init__(self, job_id: str, handle: str) -> None:
+        self.job_id = job_id
+        self.handle = handle
+        self.title = self.company = self.location = self.posted = self.applicants = ""
+        self.applied = self.easy_apply = False
+        self.inspected = False
+
+
+def parse_job_id(text: str):
+    """Job id from a bare id, a /jobs/view/<id> URL or any URL with currentJobId, else None."""
+    text = text.strip()
+    if text.isdigit():
+        return text
+    url = urlparse(text)
+    job_id = parse_qs(url.query or text).get("currentJobId")
+    if job_id:
+        return job_id[0]
+    match = re.search(r"/jobs/view/(?:[^/]*-)?(\d+)", url.path)
+    return match.group(1) if match else None
+
+
 class JobsPage(BasePage):
     path = "/jobs/search"
 
@@ -57,11 +128,82 @@ class JobsPage(BasePage):
         super().__init__(driver)
         self.current_job = None
         self.answer_provider = answer_provider
+        self.search_params = None
+        self.search_start = 0
+        # Position of each discovered job in the search results, for checkpoints
+        self.job_offsets = {}
+        # Start of the results page job_stream is on, and the tab preloading the next one
+        self.results_start = 0
+        self.prefetch_handle = None
+        # Whether job_stream reached the end of the results, rather than a page that would not load
+        self.search_finished = False
+        # Whether the session was found revoked and logged in again this run
+        self.reauthenticated = False
+        # Set to a BrowserSupervisor to have the browser recycled between jobs
+        self.supervisor = None
 
     def open(self):
-        self.driver.get(self.base_url + self.path)
+        with self.scheduler.request("page_load"):
+            self.driver.get(self.base_url + self.path)
         return self
 
+    @property
+    def scheduler(self):
+        return get_context().scheduler
+
+    def throttled(self):
+        url = self.driver.current_url
+        return any(marker in url for marker in THROTTLE_MARKERS)
+
+    def at_login_wall(self):
+        path = urlparse(self.driver.current_url).path
+        return any(path.startswith(marker) for marker in LOGIN_WALL)
+
+    def reauthenticate(self):
+        """Log in for real when LinkedIn sent this tab to its login wall; returns whether it did.
+
+        The session cookie can be revoked server-side while it still looks valid, which login()
+        cannot tell. This happens at most once per run; later walls are left to the throttling handling.
+        """
+        if self.reauthenticated or not self.at_login_wall():
+            return False
+        self.reauthenticated = True
+        print("LinkedIn rejected the session. Logging in again.")
+        credentials = get_context().config["credentials"]
+        LoginPage(self.driver).login(username=credentials["email"], password=credentials["password"], force=True)
+        return True
+
+    def navigate(self, url):
+        self.driver.get(url)
+        if self.reauthenticate():
+            self.driver.get(url)
+
+    @cached_property
+    def resolutions(self):
+        context = get_context()
+        dev = context.config["dev"]
+        # Pool workers send their records to the coordinator; only the coordinator writes to logs_dir
+        persist = dev.get("persist_answer_cache", True) and context.record_sink is None
+        # config.yaml is read once per run, so only questions.json can change answers mid-run
+        return ResolutionCache(
+            [context.questions_path],
+            max_size=dev.get("answer_cache_size", 2048),
+            path=context.log_path("answer_cache.json") if persist else None,
+            startup_sources=[context.config_path],
+        )
+
+    @cached_property
+    def form_plans(self):
+        context = get_context()
+        dev = context.config["dev"]
+        # Only the coordinator writes to logs_dir, as for the answer cache
+        persist = dev.get("persist_form_plans", True) and context.record_sink is None
+        return FormPlanCache(
+            [context.questions_path],
+            path=context.log_path("form_plans.json") if persist else None,
+            startup_sources=[context.config_path],
+        )
+
     def apply_filters(
         self,
         title=None,
@@ -76,6 +218,7 @@ class JobsPage(BasePage):
             "DIRECTOR",
             "EXECUTIVE",
         ] = None,
+        resume=False,
     ):
 
         params = {
@@ -122,51 +265,437 @@ class JobsPage(BasePage):
             elif experience_level == "EXECUTIVE":
                 params["f_E"] = "6"
 
-        url = self.base_url + self.path + "?" + urlencode(params)
+        self.search_params = params
+        self.search_start = self.resume_offset() if resume else 0
+        url = self.search_url(self.search_start)
 
-        # open URL
-        self.driver.get(url)
+        with self.scheduler.request("page_load"):
+            # open URL
+            self.navigate(url)
 
-        # wait for results to load
-        el = self.wait_for_selector(By.CSS_SELECTOR, "small.jobs-search-results-list__text")
+            # wait for results to load
+            el = self.wait_for_selector(By.CSS_SELECTOR, "small.jobs-search-results-list__text")
 
         print("Total jobs found:", el.text)
 
-    def apply(self):
-        ul = self.wait_for_selector(
+    @staticmethod
+    def filters_from_config(search):
+        """apply_filters arguments for one entry of the search section of config.yaml."""
+        return {
+            "title": search.get("keyword"),
+            "location": search.get("location"),
+            "work_location": search.get("work_location"),
+            "job_type": search.get("job_type"),
+            "experience_level": search.get("experience_level"),
+        }
+
+    def resume_offset(self):
+        """Results offset saved by an interrupted run of the same search, or 0."""
+        saved = get_context().checkpoint.load()
+        if not saved or saved.get("search_params") != self.search_params:
+            print("No checkpoint for this search. Starting from the first result.")
+            return 0
+        print(f"Resuming at result {saved['offset']}; job {saved.get('job_id')} was at step {saved.get('step')}")
+        return saved["offset"]
+
+    def save_checkpoint(self, **fields):
+        """Record progress of a search run, so that --resume can continue from here."""
+        if self.search_params is None:
+            return
+        get_context().checkpoint.update(search_params=self.search_params, **fields)
+
+    def search_url(self, start=0):
+        params = dict(self.search_params or {})
+        if start:
+            params["start"] = str(start)
+        return self.base_url + self.path + "?" + urlencode(params)
+
+    def read_job_cards(self):
+        """Cards of the results page, [] past the last result, or None when the page did not load."""
+        el = self.wait_for_selector(
             By.CSS_SELECTOR,
-            ".jobs-search-results-list > ul.scaffold-layout__list-container",
+            f"{RESULTS_LIST}, {NO_RESULTS}",
             fail=False,
         )
+        if not el:
+            return None
+        if el.tag_name.lower() != "ul":
+            return []
+        return self.get_job_cards(el)
+
+    def load_results_page(self, start, attempts=3):
+        """Navigate to the results page at start and read its cards, retrying when it does not load.
 
-        if not ul:
-            print("Jobs Results Missing on this page!")
+        Returns None when every attempt failed, for example on throttling pages.
+        """
+        for _ in range(attempts):
+            with self.scheduler.request("page_load") as request:
+                self.navigate(self.search_url(start))
+                cards = self.read_job_cards()
+                if cards is not None:
+                    return cards
+                request.fail(throttled=self.throttled())
+        return None
+
+    def open_background_tab(self, url):
+        """Start loading url in a new tab without waiting for it, and return the tab's handle."""
+        self.scheduler.acquire("page_load")
+        handles = set(self.driver.window_handles)
+        self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+        new_handles = [handle for handle in self.driver.window_handles if handle not in handles]
+        return new_handles[0] if new_handles else None
+
+    def job_stream(self, prefetch=True):
+        """Yield every result card of the current search, page by page via the start= parameter.
+
+        Cards are yielded while their page is the active tab, so callers can click them directly.
+        With prefetch on, the next page loads in a background tab while the current page is worked.
+        """
+        start = self.search_start
+        self.search_finished = False
+        cards = self.read_job_cards()
+        if cards is None:
+            cards = self.load_results_page(start)
+        while cards:
+            # One ledger query for the whole page
+            known_job_ids = get_context().ledger.known_job_ids([card.job_id for card in cards if card.job_id])
+            for card in cards:
+                card.offset = start + card.index - 1
+                card.known = card.job_id in known_job_ids
+                self.job_offsets[card.job_id] = card.offset
+            next_start = start + len(cards)
+            # Kept on self so that restore_position can drop them when the browser is replaced
+            self.results_start = start
+            self.prefetch_handle = self.open_background_tab(self.search_url(next_start)) if prefetch else None
+
+            try:
+                yield from cards
+            except GeneratorExit:
+                if self.prefetch_handle:
+                    current_handle = self.driver.current_window_handle
+                    self.driver.switch_to.window(self.prefetch_handle)
+                    self.driver.close()
+                    self.driver.switch_to.window(current_handle)
+                raise
+
+            start = next_start
+            if self.prefetch_handle:
+                # Drop the finished page and continue on the already loaded one
+                self.driver.close()
+                self.driver.switch_to.window(self.prefetch_handle)
+                cards = self.read_job_cards()
+                if cards is None:
+                    self.scheduler.observe(None, failed=True, throttled=self.throttled())
+                    cards = self.load_results_page(start)
+            else:
+                cards = self.load_results_page(start)
+
+        if cards is None:
+            print(f"Could not load the results after {start}; stopping the search here")
             return
+        self.search_finished = True
+        print(f"No more jobs after {start} results")
 
-        # TODO: Pagination Logic
+    def restore_position(self):
+        """Reopen the results page job_stream was on, after the browser has been replaced."""
+        self.prefetch_handle = None
+        if self.search_params is None:
+            return
+        self.load_results_page(self.results_start)
 
-        page_jobs = ul.find_elements(By.CSS_SELECTOR, "li")
-        for i in range(1, len(page_jobs) + 1):
-            print(f"Applying to job {i} of {len(page_jobs)}")
-            self.wait_and_click(
-                By.CSS_SELECTOR,
-                f".jobs-search-results-list > ul.scaffold-layout__list-container > li:nth-child({i})",
-            )
-            self.wait(1)
-            self.current_job = JobDetails(self.driver.current_url, self.driver)
+    def job_started(self):
+        if self.supervisor is not None:
+            self.supervisor.job_started()
 
-            applied = self.find_element(
-                by=By.CSS_SELECTOR,
-                value="li-icon.artdeco-inline-feedback__icon",
-                fail=False,
-            )
+    def job_done(self):
+        if self.supervisor is not None:
+            self.supervisor.job_done()
+
+    def pending_jobs(self):
+        """Yield the cards of the current search that still need an application."""
+        for card in self.job_stream(prefetch=get_context().config["dev"].get("prefetch_pages", True)):
+            if card.known:
+                print(f"Skipping job {card.index}: {card.job_id} already in ledger")
+                continue
+
+            if card.applied:
+                print(f"Skipping job {card.index}: already applied to {card.job_id}")
+                record_application_status(card, "ALREADY_APPLIED")
+                continue
+
+            reason = get_context().job_filter.check(card)
+            if reason:
+                print(f"Skipping job {card.index}: {reason}")
+                record_application_status(card, "SKIPPED", reason)
+                continue
+
+            yield card
+
+    def apply(self):
+        if self.search_params is None:
+            print("No search applied! Call apply_filters first.")
+            return
 
-            if applied:
-                print("Already applied to this job!")
-                record_application_status(self.current_job, "ALREADY_APPLIED")
+        depth = get_context().config["dev"].get("pipeline_depth", 0)
+        if depth > 0:
+            self.pipeline((card.job_id for card in self.pending_jobs() if card.job_id), depth)
+            self.finish_search()
+            return
+
+        for card in self.pending_jobs():
+            i = card.index
+            print(f"Applying to job {i}: {card.job_id}")
+            self.save_checkpoint(offset=card.offset, job_id=card.job_id, step=0)
+            self.job_started()
+            self.instrumentation.start_job(card.job_id)
+            previous_url = self.driver.current_url
+            with self.scheduler.request("page_load") as request:
+                self.wait_and_click(
+                    By.CSS_SELECTOR,
+                    f"{RESULTS_LIST} > li:nth-child({i})",
+                )
+                if card.job_id:
+                    self.wait_for_url_param("currentJobId", card.job_id, fail=False)
+                else:
+                    self.wait_for_url_change(previous_url, fail=False)
+                if not self.wait_for_selector(
+                    By.CSS_SELECTOR, ".jobs-details__main-content .jobs-unified-top-card", fail=False
+                ):
+                    request.fail(throttled=self.throttled())
+            self.instrumentation.mark("card_click")
+            self.apply_to_current_job()
+            self.instrumentation.end_job()
+            self.job_done()
+
+        self.finish_search()
+
+    def finish_search(self):
+        """Clear the checkpoint once the whole search is done; keep it when the results stopped loading."""
+        if self.search_finished:
+            get_context().checkpoint.clear()
+        else:
+            print("The search did not reach its last result. Run again with --resume to continue it.")
+
+    def queued_jobs(self, lines):
+        """Yield the job ids in lines (ids or URLs, read lazily) that still need an application."""
+        seen = set()
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            job_id = parse_job_id(line)
+            if job_id is None:
+                print(f"Skipping line, no job id found: {line}")
+                continue
+            if job_id in seen:
+                continue
+            seen.add(job_id)
+            if get_context().ledger.is_known(job_id):
+                print(f"Skipping job {job_id}: already in ledger")
+                continue
+            yield job_id
+
+    def apply_queue(self, lines):
+        """Apply to the listed jobs directly, without loading a search."""
+        depth = get_context().config["dev"].get("pipeline_depth", 0)
+        if depth > 0:
+            self.pipeline(self.queued_jobs(lines), depth)
+            return
+
+        for job_id in self.queued_jobs(lines):
+            print(f"Applying to job {job_id}")
+            self.apply_to_job(job_id)
+            self.job_done()
+
+    def search_all(self, searches, priority=None, keywords=None):
+        """Run every search and queue its pending jobs, each job once across all searches.
+
+        Only result pages are loaded here; job details are loaded once, when the job is applied to.
+        """
+        queue = JobQueue(priority, keywords if keywords is not None else [s.get("keyword") for s in searches])
+        for search in searches:
+            self.apply_filters(**self.filters_from_config(search))
+            queued = sum(1 for card in self.pending_jobs() if card.job_id and queue.push(card))
+            print(f"Queued {queued} jobs from search '{search.get('keyword')}' in {search.get('location')}")
+        # From here jobs are opened by id, so there is no results offset to checkpoint
+        self.search_params = None
+        print(f"{len(queue)} jobs queued, {queue.duplicates} duplicates across searches skipped")
+        return queue
+
+    def apply_searches(self, searches, priority=None, keywords=None):
+        """Apply to the pending jobs of several searches, best first."""
+        queue = self.search_all(searches, priority, keywords)
+        depth = get_context().config["dev"].get("pipeline_depth", 0)
+        if depth > 0:
+            self.pipeline(queue.job_ids(), depth)
+            return
+
+        for job_id in queue.job_ids():
+            print(f"Applying to job {job_id}")
+            self.apply_to_job(job_id)
+            self.job_done()
+
+    def job_url(self, job_id: str):
+        return self.base_url + self.path + "?" + urlencode({"currentJobId": job_id})
+
+    def open_job(self, job_id: str):
+        """Load a job straight into the details pane without going through the results list."""
+        with self.scheduler.request("page_load") as request:
+            self.navigate(self.job_url(job_id))
+            self.wait_for_url_param("currentJobId", job_id, fail=False)
+            if not self.wait_for_selector(
+                By.CSS_SELECTOR, ".jobs-details__main-content .jobs-unified-top-card", fail=False
+            ):
+                request.fail(throttled=self.throttled())
+        return self
+
+    def apply_to_job(self, job_id: str):
+        self.job_started()
+        self.instrumentation.start_job(job_id)
+        self.open_job(job_id)
+        self.instrumentation.mark("open_job")
+        self.apply_to_current_job()
+        self.instrumentation.end_job()
+
+    def apply_to_current_job(self):
+        self.current_job = JobDetails(self.driver.current_url, self.driver)
+
+        applied = self.find_element(
+            by=By.CSS_SELECTOR,
+            value="li-icon.artdeco-inline-feedback__icon",
+            fail=False,
+        )
+        self.instrumentation.mark("details")
+
+        if applied:
+            print("Already applied to this job!")
+            record_application_status(self.current_job, "ALREADY_APPLIED")
+            return
+
+        # The details can have what the card lacked, such as the applicant count
+        reason = get_context().job_filter.check(self.current_job, stage="details")
+        if reason:
+            print(f"Skipping job: {reason}")
+            record_application_status(self.current_job, "SKIPPED", reason)
+        else:
+            self.submit_current_job()
+
+    def submit_current_job(self):
+        self.easy_apply()
+        # easy_apply dismisses every modal it leaves open, so this only waits out the closing animation
+        self.wait_for_detached(By.CSS_SELECTOR, ".artdeco-modal", timeout=2, fail=False)
+        self.instrumentation.mark("modal_close")
+
+    def inspect_prefetched(self, job: PrefetchedJob):
+        """Read the details of a prefetched job if its tab has loaded. Returns whether it had."""
+        self.driver.switch_to.window(job.handle)
+        summary = self.driver.execute_script(JOB_SUMMARY)
+        if summary is None:
+            # A revoked session shows the login wall in this tab instead of the job
+            if self.reauthenticate():
+                self.driver.get(self.job_url(job.job_id))
+            return False
+        for field, value in summary.items():
+            setattr(job, field, value)
+        job.inspected = True
+        return True
+
+    def skip_reason(self, job: PrefetchedJob):
+        """Status and reason to record instead of applying, or None when the job should be applied to."""
+        if job.applied:
+            return "ALREADY_APPLIED", None
+        if not job.easy_apply:
+            return "FAILED", "Easy Apply button not found!"
+        reason = get_context().job_filter.check(job, stage="details")
+        if reason:
+            return "SKIPPED", reason
+        return None
+
+    def close_tab(self, handle, return_to):
+        self.driver.switch_to.window(handle)
+        self.driver.close()
+        self.driver.switch_to.window(return_to)
+
+    def pipeline(self, job_ids, depth):
+        """Apply to job_ids while the next `depth` jobs load in background tabs of the same browser.
+
+        Discovery keeps up to `depth` jobs loading, each in its own tab. Loaded tabs are inspected
+        as soon as they are ready, and jobs that are already applied or have no Easy Apply button
+        leave the queue there. The apply stage takes jobs from the front of the queue and fills
+        the form in the tab that is already open on the job. job_ids is only advanced from the
+        tab it was started in, so a search stream can keep driving its results page.
+        """
+        job_ids = iter(job_ids)
+        source_handle = self.driver.current_window_handle
+        pending = deque()
+        exhausted = False
+
+        while True:
+            # Discovery: top the queue back up
+            while not exhausted and len(pending) < depth:
+                self.driver.switch_to.window(source_handle)
+                job_id = next(job_ids, None)
+                # The search stream closes finished pages and moves on to the next one
+                source_handle = self.driver.current_window_handle
+                if job_id is None:
+                    exhausted = True
+                    break
+                job = PrefetchedJob(job_id, self.open_background_tab(self.job_url(job_id)))
+                if job.handle is None:
+                    # window.open was blocked; the source tab has to stay on its results page
+                    print(f"Skipping job {job_id}: could not open a tab for it")
+                    record_application_status(job, "FAILED", "Could not open a tab for the job")
+                    continue
+                pending.append(job)
+
+            # Inspection: drop what would not be applied to before it reaches the apply stage
+            skipped = False
+            for job in list(pending):
+                if job.inspected or not self.inspect_prefetched(job):
+                    continue
+                reason = self.skip_reason(job)
+                if reason:
+                    print(f"Skipping job {job.job_id}: {reason[1] or reason[0]}")
+                    record_application_status(job, *reason)
+                    pending.remove(job)
+                    self.close_tab(job.handle, source_handle)
+                    skipped = True
+            if skipped:
+                continue
+
+            if not pending:
+                break
+
+            # Apply
+            job = pending.popleft()
+            print(f"Applying to job {job.job_id}")
+            # Jobs are applied in discovery order, so every result before this one is finished
+            if job.job_id in self.job_offsets:
+                self.save_checkpoint(offset=self.job_offsets.pop(job.job_id), job_id=job.job_id, step=0)
+            self.instrumentation.start_job(job.job_id)
+            # Jobs inspected ahead of time already passed skip_reason
+            reason = None
+            if not job.inspected:
+                if self.wait_until(lambda _: self.inspect_prefetched(job), fail=False):
+                    reason = self.skip_reason(job)
+                else:
+                    self.scheduler.observe(None, failed=True, throttled=self.throttled())
+                    reason = ("FAILED", "Job details did not load")
+
+            if reason:
+                print(f"Skipping job {job.job_id}: {reason[1] or reason[0]}")
+                record_application_status(job, *reason)
             else:
-                self.easy_apply()
-                self.wait(1)
+                self.driver.switch_to.window(job.handle)
+                self.current_job = job
+                self.instrumentation.mark("details")
+                self.submit_current_job()
+            self.instrumentation.end_job()
+            self.close_tab(job.handle, source_handle)
+
+    def get_job_cards(self, ul: WebElement):
+        # Rendering the cards LinkedIn skipped takes a scroll each; 10 s covers a full page of 25
+        return [JobCard(**card) for card in self.driver.execute_async_script(JOB_CARDS, ul, 10000)]
 
     def easy_apply(self):
         failed = False
@@ -206,8 +735,12 @@ class JobsPage(BasePage):
                 progress = int(progress_el.get_attribute("value"))
             else:
                 print("No progress element found! Considering 100% progress")
+            self.instrumentation.mark("open_modal")
 
+            step = 0
             while progress < 100:
+                step += 1
+                self.save_checkpoint(step=step)
                 button = None
 
                 # next button
@@ -228,34 +761,17 @@ class JobsPage(BasePage):
                 assert button, "No next or review button found!"
 
                 # Fill out the form
-                pb4 = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-content div.pb4")
-
-                for el in pb4:
-                    try:
-                        self.try_upload_resume(el)
-                    except Exception:
-                        pass
-
-                    try:
-                        self.try_fill_questions(el)
-                    except Exception:
-                        pass
+                self.fill_form_step(step)
 
                 button.click()
-                self.wait(0.5)
 
-                new_progress = self.wait_for_selector(
-                    By.CSS_SELECTOR,
-                    ".jobs-easy-apply-content progress.artdeco-completeness-meter-linear__progress-element",
-                    fail=False,
-                )
-
-                assert new_progress, "Progress element not found!"
-                new_progress = int(progress_el.get_attribute("value"))
+                new_progress, error = self.wait_for_next_step(progress)
 
-                assert new_progress != progress, "Progress not updated! Could not fill details?"
+                assert not error, f"Step not accepted: {error}"
+                assert new_progress, "Progress not updated! Could not fill details?"
 
-                progress = new_progress
+                progress = int(new_progress)
+                self.instrumentation.mark(f"form_step_{step}")
 
         except Exception as e:
             failed = True
@@ -266,27 +782,166 @@ class JobsPage(BasePage):
 
         if not failed:
             # Don't submit in test mode
-            if config["dev"]["test_mode"]:
+            if get_context().config["dev"]["test_mode"]:
                 print("Test mode. Not submitting application.")
                 record_application_status(self.current_job, "APPLIED_TEST_MODE")
                 close_modal = True
             else:
-                self.wait_and_click(
-                    By.CSS_SELECTOR,
-                    "button.jobs-apply-form__submit-button",
-                )
-                record_application_status(self.current_job, "APPLIED")
+                with self.scheduler.request("application") as request:
+                    self.wait_and_click(
+                        By.CSS_SELECTOR,
+                        "button.jobs-apply-form__submit-button",
+                    )
+                    submitted = self.wait_for_detached(
+                        By.CSS_SELECTOR, "button.jobs-apply-form__submit-button", timeout=10, fail=False
+                    )
+                    if not submitted:
+                        request.fail()
+                self.instrumentation.mark("submit")
+
+                if submitted:
+                    record_application_status(self.current_job, "APPLIED")
+                    # The confirmation modal stays open until dismissed, and renders a moment after the form goes
+                    dismiss = self.wait_for_selector(By.CSS_SELECTOR, ".artdeco-modal__dismiss", timeout=3, fail=False)
+                    if dismiss:
+                        dismiss.click()
+                else:
+                    print("Failed to apply to this job. Reason: the application was not submitted")
+                    record_application_status(self.current_job, "FAILED", "Application was not submitted")
+                    close_modal = True
 
         if close_modal:
             self.wait_and_click(
                 By.CSS_SELECTOR,
                 ".artdeco-modal__dismiss",
             )
-            self.wait(0.5)
-            self.wait_and_click(
-                By.CSS_SELECTOR,
-                ".artdeco-modal__confirm-dialog-btn:nth-child(1)",
+            self.wait_until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, ".artdeco-modal__confirm-dialog-btn:nth-child(1)"))
+            ).click()
+            self.instrumentation.mark("dismiss")
+
+    def wait_for_next_step(self, progress):
+        """Wait for the progress bar to move past progress; returns (new progress, validation error).
+
+        Stops as soon as the step shows a validation error, such as a required question left
+        unanswered, since the step will not advance then. Otherwise waits up to dev.step_timeout.
+        """
+        dev = get_context().config["dev"]
+        timeout = dev.get("step_timeout", dev["timeout"]) / 1000
+
+        def condition(driver):
+            errors = driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-content .artdeco-inline-feedback--error")
+            for error in errors:
+                if error.is_displayed():
+                    return None, error.text.strip() or "validation error"
+            current = driver.find_element(
+                By.CSS_SELECTOR, ".jobs-easy-apply-content progress.artdeco-completeness-meter-linear__progress-element"
+            ).get_attribute("value")
+            return (current, None) if current != str(progress) else False
+
+        return self.wait_until(condition, timeout=timeout, fail=False) or (None, None)
+
+    def fill_form_step(self, step=None):
+        if get_context().config["dev"].get("snapshot_forms"):
+            try:
+                self.try_fill_form_snapshot(step)
+            except Exception as e:
+                print(f"Failed to fill form snapshot: {e}")
+            return
+
+        pb4 = self.driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-content div.pb4")
+
+        for el in pb4:
+            try:
+                self.try_upload_resume(el)
+            except Exception:
+                pass
+
+            try:
+                self.try_fill_questions(el)
+            except Exception:
+                pass
+
+    def try_fill_form_snapshot(self, step=None):
+        """Read the whole step in one script call, resolve answers in Python and apply them in one more.
+
+        With dev.form_plans on, a step whose signature was seen before reuses its stored answers, and
+        when the employer's previous form predicts the step, reading and filling it take one call.
+        """
+        plans = self.form_plans if get_context().config["dev"].get("form_plans", True) else None
+        employer = getattr(self.current_job, "company", "") or ""
+
+        plan = plans.predict(employer, step) if plans else None
+        if plan:
+            updates = [
+                [index, type, str(answer)] for index, (type, _, _, answer) in enumerate(plan["fields"]) if answer
+            ]
+            result = self.driver.execute_script(REPLAY_FORM, plan["signature"], updates)
+            snapshot, failed = result["snapshot"], result["failed"]
+            if failed is None:
+                plan = None
+        else:
+            snapshot, failed = self.driver.execute_script(SNAPSHOT_FORM), None
+
+        for el in snapshot["uploads"]:
+            try:
+                self.try_upload_resume(el)
+            except Exception:
+                pass
+
+        fields = snapshot["fields"]
+        if plan is None and plans:
+            plan = plans.lookup(snapshot["signature"])
+        if plans:
+            plans.count(employer, plan is not None)
+
+        if plan is not None:
+            answers = [answer for *_, answer in plan["fields"]]
+            plans.use(employer, step, snapshot["signature"])
+        else:
+            answers = [
+                self.resolve_answer(field["question"].lower(), field["type"], field["options"]) for field in fields
+            ]
+            if plans:
+                plan_fields = [
+                    [field["type"], field["question"].lower(), field["options"], answer]
+                    for field, answer in zip(fields, answers)
+                ]
+                plans.store(employer, step, snapshot["signature"], plan_fields)
+
+        updates = []
+        for index, (field, to_enter) in enumerate(zip(fields, answers)):
+            ques = field["question"].lower()
+            type = field["type"]
+
+            if field["value"]:
+                record_answered_question(self.current_job, ques, type, field["value"])
+                continue
+
+            if to_enter:
+                updates.append((index, type, str(to_enter)))
+                record_answered_question(self.current_job, ques, type, to_enter)
+            else:
+                record_unprepared_question(self.current_job, ques, type, field["options"])
+
+        # A replayed plan has already been applied
+        if failed is None:
+            if not updates:
+                return
+            failed_updates = self.driver.execute_script(
+                APPLY_FORM, [[fields[index]["element"], type, value] for index, type, value in updates]
             )
+            failed = [updates[i][0] for i in failed_updates]
+
+        # Fall back to typing for text fields the script could not set
+        values = {index: value for index, _, value in updates}
+        for index in failed:
+            if fields[index]["type"] == "TEXT" and index in values:
+                text_field = self.find_element(
+                    fields[index]["element"], By.CSS_SELECTOR, "input:not([type='file']), textarea", False
+                )
+                if text_field:
+                    text_field.send_keys(values[index])
 
     def try_upload_resume(self, el: WebElement):
         inp = el.find_element(By.CSS_SELECTOR, "input[type='file']")
@@ -366,33 +1021,7 @@ class JobsPage(BasePage):
         if answered:
             record_answered_question(self.current_job, ques, "TEXT", value)
         else:
-            to_enter = None
-            if "years of experience" in ques or "work experience" in ques:
-                for experience in self.answer_provider.get_basic_answer("experience"):
-                    year = experience.get("years")
-                    skills = experience.get("skills")
-                    for tech in skills:
-                        if tech in ques:
-                            to_enter = year
-                            break
-
-                if not to_enter:
-                    to_enter = self.answer_provider.get_basic_answer("default_experience")
-
-            elif ques == "first name":
-                to_enter = self.answer_provider.get_basic_answer("first_name")
-            elif ques == "last name":
-                to_enter = self.answer_provider.get_basic_answer("last_name")
-            elif ques == "mobile phone number":
-                to_enter = self.answer_provider.get_basic_answer("mobile_phone_number")
-            elif ques == "email address":
-                to_enter = self.answer_provider.get_basic_answer("email_address")
-            elif ques == "city":
-                to_enter = self.answer_provider.get_basic_answer("city")
-
-            # Additional Questions
-            if not to_enter:
-                to_enter = self.answer_provider.get_answer(ques)
+            to_enter = self.resolve_answer(ques, "TEXT")
 
             # Enter the value
             if to_enter:
@@ -406,6 +1035,42 @@ class JobsPage(BasePage):
 
         return True
 
+    def resolve_answer(self, ques: str, type: str, options=None):
+        """Resolve an answer once per run, or until config.yaml or questions.json change."""
+        if type == "TEXT":
+            options = None
+        key = (type, normalize_question(ques), tuple(sorted(options)) if options is not None else None)
+        found, answer = self.resolutions.get(key)
+        if not found:
+            if type == "TEXT":
+                answer = self.resolve_text_answer(ques)
+            else:
+                answer = self.answer_provider.get_answer(ques, options)
+            self.resolutions.put(key, answer)
+        return answer
+
+    def resolve_text_answer(self, ques: str):
+        to_enter = None
+        if "years of experience" in ques or "work experience" in ques:
+            to_enter = self.answer_provider.get_experience_years(ques)
+
+        elif ques == "first name":
+            to_enter = self.answer_provider.get_basic_answer("first_name")
+        elif ques == "last name":
+            to_enter = self.answer_provider.get_basic_answer("last_name")
+        elif ques == "mobile phone number":
+            to_enter = self.answer_provider.get_basic_answer("mobile_phone_number")
+        elif ques == "email address":
+            to_enter = self.answer_provider.get_basic_answer("email_address")
+        elif ques == "city":
+            to_enter = self.answer_provider.get_basic_answer("city")
+
+        # Additional Questions
+        if not to_enter:
+            to_enter = self.answer_provider.get_answer(ques)
+
+        return to_enter
+
     def try_fill_radio(self, el: WebElement):
         ques_el = self.find_element(
             el, By.CSS_SELECTOR, "div.jobs-easy-apply-form-element legend span[aria-hidden='true']", False
@@ -1,18 +1,42 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from .Base import BasePage
+import time
 
 
 class LoginPage(BasePage):
     path = "/login"
 
-    def __init__(self, driver: webdriver.Chrome):
-        super().__init__(driver)
+    # LinkedIn's session cookie
+    session_cookie = "li_at"
+
+    def open(self):
         self.driver.get(self.base_url + self.path)
-        self.wait(2)
+        self.wait_for_page_load(fail=False)
+        return self
+
+    def has_valid_session(self):
+        """Check the profile's session cookie over CDP, without loading any LinkedIn page."""
+        try:
+            cookies = self.driver.execute_cdp_cmd("Network.getCookies", {"urls": [self.base_url]})["cookies"]
+        except Exception:
+            return False
+        now = time.time()
+        for cookie in cookies:
+            if cookie["name"] == self.session_cookie and cookie["value"]:
+                # Session cookies carry no expiry
+                expires = cookie.get("expires", -1)
+                return cookie.get("session", False) or expires <= 0 or expires > now
+        return False
+
+    def login(self, username: str, password: str, force=False):
+        """Log in unless the profile has a session; force skips that check, for a session LinkedIn revoked."""
+        if not force and self.has_valid_session():
+            print("Already Logged In")
+            return self
 
-    def login(self, username: str, password: str):
-        if "LinkedIn" in self.driver.title:
+        self.open()
+        if not force and "LinkedIn" in self.driver.title:
             print("Already Logged In")
             return self
 
@@ -26,7 +50,7 @@ class LoginPage(BasePage):
             otp = input("Enter OTP: ")
             otp_elem = self.wait_and_type(By.CSS_SELECTOR, "[name='pin']", otp)
             otp_elem.submit()
-            self.wait(5)
+            self.wait_until(EC.title_contains("LinkedIn"), fail=False)
 
         assert "LinkedIn" in self.driver.title, "Login Failed"
         return self
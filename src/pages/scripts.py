@@ -0,0 +1,180 @@
+# JavaScript run through driver.execute_script so that whole-page reads and writes cost one round trip
+
+# snapshotForm() returns the structure of the current Easy Apply step:
+#   uploads: the div.pb4 sections holding a file input
+#   fields: one entry per form grouping with its element handle, control type, question, options and value
+#   signature: the questions, control types and options of every field, which identify the form template
+SNAPSHOT_FUNCTION = """
+const snapshotForm = () => {
+    const GROUP_TITLE = "preceding::span[contains(@class, 'jobs-easy-apply-form-section__group-title')][1]";
+    const EMPTY_OPTIONS = ["", "Select an option"];
+    const text = (el) => (el ? el.innerText.trim() : null);
+    const precedingTitle = (el) =>
+        document.evaluate(GROUP_TITLE, el, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+
+    const sections = Array.from(document.querySelectorAll(".jobs-easy-apply-content div.pb4"));
+    const uploads = sections.filter((section) => section.querySelector("input[type='file']"));
+    const fields = [];
+
+    sections.forEach((section) => {
+        section.querySelectorAll("div.jobs-easy-apply-form-section__grouping").forEach((group) => {
+            const radios = Array.from(group.querySelectorAll(".fb-text-selectable__option input"));
+            const radioLabel = group.querySelector("div.jobs-easy-apply-form-element legend span[aria-hidden='true']");
+            const formElement = group.querySelector("div.jobs-easy-apply-form-element");
+            const select = group.querySelector("select");
+            const input = group.querySelector("input:not([type='file']), textarea");
+
+            if (radioLabel && radios.length) {
+                const checked = radios.find((radio) => radio.checked);
+                fields.push({
+                    element: group,
+                    type: "RADIO",
+                    question: text(radioLabel),
+                    options: radios.map((radio) => radio.value),
+                    value: checked ? checked.value : null,
+                });
+            } else if (formElement && select) {
+                const label = formElement.querySelector("label span:not(.visually-hidden)") || precedingTitle(group);
+                if (!label) return;
+                const options = Array.from(select.options).filter((option) => !EMPTY_OPTIONS.includes(option.value));
+                fields.push({
+                    element: group,
+                    type: "DROPDOWN",
+                    question: text(label),
+                    options: options.map((option) => text(option)),
+                    value: EMPTY_OPTIONS.includes(select.value) ? null : select.value,
+                });
+            } else if (input) {
+                let label = group.querySelector("label");
+                if (label && label.querySelector("span[aria-hidden='true']")) {
+                    label = label.querySelector("span[aria-hidden='true']");
+                }
+                label = label || precedingTitle(group);
+                if (!label) return;
+                fields.push({
+                    element: group,
+                    type: "TEXT",
+                    question: text(label),
+                    options: null,
+                    value: input.value || null,
+                });
+            }
+        });
+    });
+
+    const signature = JSON.stringify(fields.map((field) => [field.type, field.question, field.options]));
+    return { uploads: uploads, fields: fields, signature: signature };
+};
+"""
+
+SNAPSHOT_FORM = SNAPSHOT_FUNCTION + "return snapshotForm();"
+
+# applyForm() applies [group, type, value] updates from a snapshot and returns the indexes that could not be applied
+APPLY_FUNCTION = """
+const setValue = (el, value) => {
+    const proto = Object.getPrototypeOf(el);
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(el, value);
+    el.dispatchEvent(new Event("input", { bubbles: true }));
+    el.dispatchEvent(new Event("change", { bubbles: true }));
+};
+
+const applyForm = (updates) => {
+    const failed = [];
+    updates.forEach(([group, type, value], index) => {
+        try {
+            if (type === "RADIO") {
+                const radios = Array.from(group.querySelectorAll(".fb-text-selectable__option input"));
+                radios.find((radio) => radio.value === value).click();
+            } else if (type === "DROPDOWN") {
+                const select = group.querySelector("select");
+                const option = Array.from(select.options).find((o) => o.text.trim() === value || o.value === value);
+                setValue(select, option.value);
+            } else {
+                setValue(group.querySelector("input:not([type='file']), textarea"), value);
+            }
+        } catch (e) {
+            failed.push(index);
+        }
+    });
+    return failed;
+};
+"""
+
+APPLY_FORM = APPLY_FUNCTION + "return applyForm(arguments[0]);"
+
+# Replays a fill plan in one call when the step still has the plan's signature (arguments[0]).
+# arguments[1] holds [field index, type, value] updates; fields that already have a value are left alone.
+# Returns the snapshot, and failed: the field indexes that could not be set, or null if the signature differed.
+REPLAY_FORM = (
+    SNAPSHOT_FUNCTION
+    + APPLY_FUNCTION
+    + """
+const snapshot = snapshotForm();
+if (snapshot.signature !== arguments[0]) return { snapshot: snapshot, failed: null };
+const updates = arguments[1].filter(([index]) => !snapshot.fields[index].value);
+const failed = applyForm(updates.map(([index, type, value]) => [snapshot.fields[index].element, type, value]));
+return { snapshot: snapshot, failed: failed.map((i) => updates[i][0]) };
+"""
+)
+
+# Reads every result card in the list passed as arguments[0]. LinkedIn only renders the cards near the
+# viewport; the others carry nothing but their id until scrolled to. So each unrendered card is scrolled
+# into view and waited for, within an overall budget of arguments[1] ms, before anything is read.
+# Run with execute_async_script.
+JOB_CARDS = """
+const [list, budget, done] = arguments;
+const text = (el) => (el ? el.innerText.trim() : "");
+const rendered = (li) => li.querySelector(".job-card-list__title") !== null;
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+const readCard = (li, index) => {
+    const state = li.querySelector(".job-card-container__footer-job-state");
+    const idEl = li.querySelector("[data-job-id]");
+    const time = li.querySelector("time");
+    const applicants = text(li).match(/(over\\s+)?\\d[\\d,]*\\s+applicants?|early applicant/i);
+    return {
+        index: index + 1,
+        job_id: li.getAttribute("data-occludable-job-id") || (idEl ? idEl.getAttribute("data-job-id") : ""),
+        title: text(li.querySelector(".job-card-list__title")),
+        company: text(li.querySelector(".job-card-container__primary-description, .artdeco-entity-lockup__subtitle")),
+        location: text(li.querySelector(".job-card-container__metadata-item, .artdeco-entity-lockup__caption")),
+        applied: /applied/i.test(text(state)),
+        posted: time ? time.getAttribute("datetime") || "" : "",
+        applicants: applicants ? applicants[0] : "",
+    };
+};
+
+(async () => {
+    const cards = Array.from(list.querySelectorAll(":scope > li"));
+    const deadline = Date.now() + budget;
+    let scrolled = false;
+    for (const li of cards) {
+        if (rendered(li)) continue;
+        li.scrollIntoView({ block: "center" });
+        scrolled = true;
+        while (!rendered(li) && Date.now() < deadline) await sleep(50);
+    }
+    if (scrolled) list.scrollIntoView({ block: "start" });
+    done(cards.map(readCard));
+})();
+"""
+
+# Details and Easy Apply eligibility of the job shown in this tab, or null while it is still loading
+JOB_SUMMARY = """
+const text = (el) => (el ? el.innerText.trim() : "");
+const card = document.querySelector(".jobs-details__main-content .jobs-unified-top-card");
+if (document.readyState !== "complete" || !card) return null;
+const details = text(
+    card.querySelector(".job-details-jobs-unified-top-card__primary-description-without-tagline")
+).split("·").map((part) => part.trim());
+const button = document.querySelector("div.jobs-details__main-content button.jobs-apply-button");
+return {
+    title: text(card.querySelector("span.job-details-jobs-unified-top-card__job-title-link")),
+    company: details[0] || "",
+    location: details[1] || "",
+    posted: details[2] || "",
+    applicants: details[3] || "",
+    applied: document.querySelector("li-icon.artdeco-inline-feedback__icon") !== null,
+    easy_apply: button !== null && /easy apply/i.test(button.innerText),
+};
+"""
@@ -0,0 +1,204 @@
+import multiprocessing
+import os
+import queue
+import time
+from collections import deque
+from types import SimpleNamespace
+import utils
+
+
+def worker_main(worker_id, inbox, results, config_path, questions_path):
+    """Run one browser session that applies to the job ids sent to its inbox."""
+    from browser import create_browser, close_browser
+    from pages.Jobs import JobsPage
+    from pages.Login import LoginPage
+    from providers.answer_providers import JsonAnswerProvider
+    from supervisor import BrowserSupervisor
+    from instrumentation import instrumentation
+
+    context = utils.set_context(utils.AppContext(config_path, questions_path))
+    config = context.config
+    instrumentation.enabled = config["dev"].get("instrumentation", True)
+
+    # Every record goes back to the coordinator, the only process that writes the logs
+    context.record_sink = lambda name, job, *args: results.put(("record", worker_id, name, job, args))
+
+    # Workers always launch their own browser; the attach address belongs to the coordinator
+    profile_dir = os.path.join("userData", f"worker-{worker_id}")
+    browser = create_browser(profile_dir, attach=False)
+    jobs_page = None
+    try:
+        LoginPage(browser).login(username=config["credentials"]["email"], password=config["credentials"]["password"])
+        jobs_page = JobsPage(browser, JsonAnswerProvider(questions_path))
+        if config.get("recycle"):
+            jobs_page.supervisor = BrowserSupervisor(
+                jobs_page,
+                profile_dir,
+                config["credentials"],
+                attach=False,
+                settings=config["recycle"],
+                log_name=f"browser_recycles_worker_{worker_id}.csv",
+            )
+        results.put(("ready", worker_id, None))
+
+        while True:
+            job_id = inbox.get()
+            if job_id is None:
+                break
+            try:
+                jobs_page.apply_to_job(job_id)
+            except Exception as e:
+                print(f"[worker {worker_id}] Failed to apply to {job_id}: {e}")
+            results.put(("done", worker_id, job_id))
+            jobs_page.job_done()
+    finally:
+        if jobs_page is not None and jobs_page.supervisor is not None:
+            jobs_page.supervisor.close()
+        else:
+            close_browser(jobs_page.driver if jobs_page is not None else browser)
+        # A separate file per worker, so this does not race the coordinator's logs
+        instrumentation.write_report(context.logs_dir, f"instrumentation_worker_{worker_id}")
+
+
+class WorkerPool:
+    """Hands job ids to browser worker processes and records their results in this process."""
+
+    def __init__(self, workers, config_path, questions_path, max_attempts=2, max_restarts=None):
+        self.size = workers
+        self.config_path = config_path
+        self.questions_path = questions_path
+        self.max_attempts = max_attempts
+        self.max_restarts = max_restarts if max_restarts is not None else workers * 2
+        self.context = multiprocessing.get_context("spawn")
+        self.results = self.context.Queue()
+        self.processes = {}
+        self.inboxes = {}
+        self.idle = set()
+        self.in_flight = {}
+        self.attempts = {}
+        self.retry = deque()
+        self.restarts = 0
+        self.exhausted = False
+
+    target = staticmethod(worker_main)
+
+    def start_worker(self, worker_id):
+        inbox = self.context.Queue()
+        process = self.context.Process(
+            target=self.target,
+            args=(worker_id, inbox, self.results, self.config_path, self.questions_path),
+            name=f"linkedin-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        self.inboxes[worker_id] = inbox
+        self.processes[worker_id] = process
+
+    def start(self):
+        for worker_id in range(self.size):
+            self.start_worker(worker_id)
+
+    def dispatch(self, worker_id, job_id):
+        self.idle.discard(worker_id)
+        self.in_flight[worker_id] = job_id
+        self.attempts[job_id] = self.attempts.get(job_id, 0) + 1
+        self.inboxes[worker_id].put(job_id)
+
+    def handle_message(self, message):
+        kind, worker_id, *payload = message
+        if kind == "record":
+            name, job, args = payload
+            getattr(utils, name)(SimpleNamespace(**job), *args)
+        elif kind == "ready":
+            self.idle.add(worker_id)
+        elif kind == "done":
+            self.in_flight.pop(worker_id, None)
+            self.idle.add(worker_id)
+
+    def drain(self, timeout=1.0):
+        """Apply every message that is waiting, blocking up to timeout for the first one."""
+        try:
+            self.handle_message(self.results.get(timeout=timeout))
+            while True:
+                self.handle_message(self.results.get_nowait())
+        except queue.Empty:
+            pass
+
+    def reap(self):
+        """Requeue the in-flight job of any worker that died, and replace the worker."""
+        for worker_id, process in list(self.processes.items()):
+            if process.is_alive():
+                continue
+
+            del self.processes[worker_id]
+            self.idle.discard(worker_id)
+            job_id = self.in_flight.pop(worker_id, None)
+            print(f"Worker {worker_id} exited with code {process.exitcode}")
+
+            if job_id is not None:
+                if self.attempts[job_id] < self.max_attempts:
+                    print(f"Requeueing job {job_id}")
+                    self.retry.append(job_id)
+                else:
+                    job = SimpleNamespace(**utils.job_fields(SimpleNamespace(job_id=job_id)))
+                    utils.record_application_status(job, "FAILED", f"Worker crashed {self.attempts[job_id]} times")
+
+            if self.restarts < self.max_restarts:
+                self.restarts += 1
+                self.start_worker(worker_id)
+
+    def next_job(self, job_ids):
+        if self.retry:
+            return self.retry.popleft()
+        if self.exhausted:
+            return None
+        job_id = next(job_ids, None)
+        if job_id is None:
+            self.exhausted = True
+        return job_id
+
+    def run(self, job_ids):
+        job_ids = iter(job_ids)
+        self.exhausted = False
+
+        while True:
+            while self.idle:
+                job_id = self.next_job(job_ids)
+                if job_id is None:
+                    break
+                self.dispatch(self.idle.pop(), job_id)
+
+            if self.exhausted and not self.in_flight and not self.retry:
+                break
+            if not self.processes:
+                print("All workers exited. Stopping pool.")
+                break
+
+            self.drain()
+            self.reap()
+
+        self.stop()
+
+    def stop(self):
+        for inbox in self.inboxes.values():
+            inbox.put(None)
+        # Keep draining while workers exit so none blocks flushing its last records
+        deadline = time.monotonic() + 30
+        while any(process.is_alive() for process in self.processes.values()) and time.monotonic() < deadline:
+            self.drain(timeout=0.1)
+        self.drain(timeout=0.1)
+
+
+def run_pool(jobs_page, workers, job_ids=None):
+    """Feed job_ids, or the coordinator's search stream by default, to a pool of browser workers."""
+    context = utils.get_context()
+    pool = WorkerPool(
+        workers,
+        context.config_path,
+        context.questions_path,
+        max_attempts=context.config.get("pool", {}).get("max_attempts", 2),
+    )
+    pool.start()
+    if job_ids is None:
+        job_ids = (card.job_id for card in jobs_page.pending_jobs() if card.job_id)
+    pool.run(job_ids)
@@ -1,17 +1,33 @@
 import abc
 import json
-from utils import config
+import os
+from functools import cached_property
+from providers.skill_matcher import SkillMatcher
+from utils import get_context
+
+
+def normalize_question(question):
+    return " ".join(str(question).lower().split())
 
 
 class AnswerProvider(abc.ABC):
     def __init__(self):
-        self.basic_answers = config["basic_questions"]
+        self.basic_answers = get_context().config["basic_questions"]
 
     def get_basic_answer(self, ques_id):
         if ques_id not in self.basic_answers:
             raise ValueError(f"Question ID '{ques_id}' not found in config.yaml")
         return self.basic_answers[ques_id]
 
+    @cached_property
+    def skill_matcher(self):
+        return SkillMatcher(self.basic_answers.get("experience"), self.basic_answers.get("skill_aliases"))
+
+    def get_experience_years(self, question):
+        """Years of experience for the skill a question asks about, falling back to default_experience."""
+        years = self.skill_matcher.years(question)
+        return years if years is not None else self.get_basic_answer("default_experience")
+
     @abc.abstractmethod
     def get_answer(self, question, options=None):
         pass
@@ -20,17 +36,53 @@ class AnswerProvider(abc.ABC):
 class JsonAnswerProvider(AnswerProvider):
     def __init__(self, filepath):
         super().__init__()
-        with open(filepath, "r") as f:
-            self.answers = json.load(f)
+        self.filepath = filepath
+        self.answers = []
+        self.index = {}
+        self.mtime = None
+        self.reload()
+
+    @staticmethod
+    def make_key(type, question, options=None):
+        return (type, normalize_question(question), frozenset(options) if options is not None else None)
+
+    def reload(self):
+        """Re-read the answers file and rebuild the lookup index if it changed on disk."""
+        try:
+            mtime = os.stat(self.filepath).st_mtime_ns
+        except OSError:
+            if self.mtime is None:
+                raise
+            return
+        if mtime == self.mtime:
+            return
+
+        with open(self.filepath, "r") as f:
+            answers = json.load(f)
+
+        # Entries are only ever appended, so when the old ones are unchanged only the tail needs indexing
+        count = len(self.answers)
+        if count and answers[:count] == self.answers:
+            index = self.index
+            new_answers = answers[count:]
+        else:
+            index = {}
+            new_answers = answers
+
+        for q in new_answers:
+            index[self.make_key(q.get("type"), q.get("question", ""), q.get("options"))] = q.get("answer")
+
+        self.answers = answers
+        self.index = index
+        self.mtime = mtime
 
     def get_answer(self, question, options=None):
-        answer = None
+        self.reload()
         if options is None:
-            for q in self.answers:
-                if q.type == "TEXT" and q["question"] == question:
-                    answer = q["answer"]
-        else:
-            for q in self.answers:
-                if q.type in ["DROPDOWN", "RADIO"] and q["question"] == question and set(q["options"]) == set(options):
-                    answer = q["answer"]
-        return answer
+            return self.index.get(self.make_key("TEXT", question))
+
+        for type in ["DROPDOWN", "RADIO"]:
+            answer = self.index.get(self.make_key(type, question, options))
+            if answer is not None:
+                return answer
+        return None
@@ -0,0 +1,81 @@
+import atexit
+import json
+import os
+from writers import write_atomic
+
+
+def source_fingerprint(sources):
+    """mtime and size of each source file, to tell whether anything cached from them is stale."""
+    fingerprint = []
+    for source in sources:
+        try:
+            stat = os.stat(source)
+            fingerprint.append([stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            fingerprint.append(None)
+    return fingerprint
+
+
+class FingerprintedStore:
+    """Base of the caches derived from source files, optionally saved to a JSON file between runs.
+
+    Everything is dropped when one of the sources (questions.json, which the answer provider
+    reloads) changes on disk. startup_sources (config.yaml) are only read when a run starts, so
+    they are not watched; they only key the saved file, which is reused while all sources are
+    unchanged. With a path, the file is loaded on first use and written back at exit.
+
+    Subclasses implement restore(saved), clear() and state().
+    """
+
+    def __init__(self, sources, path=None, startup_sources=()):
+        self.sources = sources
+        self.startup_sources = startup_sources
+        self.path = path
+        self.fingerprint = None
+        self.startup_fingerprint = None
+        self.loaded = False
+        self.dirty = False
+        self.invalidations = 0
+
+    def restore(self, saved):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def state(self):
+        raise NotImplementedError
+
+    def load(self):
+        self.loaded = True
+        self.fingerprint = source_fingerprint(self.sources)
+        self.startup_fingerprint = source_fingerprint(self.startup_sources)
+        if not self.path:
+            return
+        atexit.register(self.save)
+        try:
+            with open(self.path, "r") as file:
+                saved = json.load(file)
+        except (OSError, ValueError):
+            return
+        if saved.get("sources") != self.fingerprint or saved.get("startup_sources") != self.startup_fingerprint:
+            return
+        self.restore(saved)
+
+    def validate(self):
+        if not self.loaded:
+            self.load()
+            return
+        fingerprint = source_fingerprint(self.sources)
+        if fingerprint != self.fingerprint:
+            self.clear()
+            self.fingerprint = fingerprint
+            self.invalidations += 1
+            self.dirty = True
+
+    def save(self):
+        if not self.path or not self.dirty:
+            return
+        state = {"sources": self.fingerprint, "startup_sources": self.startup_fingerprint, **self.state()}
+        write_atomic(self.path, lambda file: json.dump(state, file))
+        self.dirty = False
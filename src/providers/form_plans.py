@@ -0,0 +1,80 @@
+import hashlib
+from collections import OrderedDict
+from providers.fingerprinted_store import FingerprintedStore
+
+
+class FormPlanCache(FingerprintedStore):
+    """Fill plans of Easy Apply steps, keyed by the step's signature (questions, control types, options).
+
+    A plan holds the resolved answer of every field, so a step seen before is filled without
+    resolving anything. For each employer the plan used at each step is remembered too, which
+    lets the next posting of that employer try the plan before the step has been read.
+    Staleness and saving are handled by FingerprintedStore.
+    """
+
+    def __init__(self, sources, max_plans=1000, path=None, startup_sources=()):
+        super().__init__(sources, path, startup_sources)
+        self.max_plans = max_plans
+        self.plans = OrderedDict()
+        self.employers = {}
+        self.stats = {}
+
+    @staticmethod
+    def key(signature):
+        return hashlib.sha1(signature.encode()).hexdigest()[:16]
+
+    def restore(self, saved):
+        self.plans.update((self.key(plan["signature"]), plan) for plan in saved.get("plans", []))
+        self.employers = saved.get("employers", {})
+
+    def clear(self):
+        self.plans.clear()
+        self.employers.clear()
+
+    def state(self):
+        return {"plans": list(self.plans.values()), "employers": self.employers}
+
+    def predict(self, employer, step):
+        """The plan this employer's form used at this step last time, or None."""
+        self.validate()
+        key = self.employers.get(employer, {}).get(str(step))
+        return self.plans.get(key) if key else None
+
+    def lookup(self, signature):
+        self.validate()
+        return self.plans.get(self.key(signature))
+
+    def store(self, employer, step, signature, fields):
+        """Remember a plan: fields are [type, question, options, answer] in snapshot order."""
+        key = self.key(signature)
+        self.plans[key] = {"signature": signature, "fields": fields}
+        if len(self.plans) > self.max_plans:
+            self.plans.popitem(last=False)
+        self.dirty = True
+        self.use(employer, step, signature)
+
+    def use(self, employer, step, signature):
+        """Note that the employer's form had this signature at this step, and keep its plan fresh."""
+        key = self.key(signature)
+        steps = self.employers.setdefault(employer, {})
+        if steps.get(str(step)) != key:
+            steps[str(step)] = key
+            self.dirty = True
+        self.plans.move_to_end(key)
+
+    def count(self, employer, hit):
+        stats = self.stats.setdefault(employer, {"hits": 0, "misses": 0})
+        stats["hits" if hit else "misses"] += 1
+
+    def report(self):
+        hits = sum(stats["hits"] for stats in self.stats.values())
+        steps = hits + sum(stats["misses"] for stats in self.stats.values())
+        return {
+            "steps": steps,
+            "hit_rate": round(hits / steps, 3) if steps else 0,
+            "plans": len(self.plans),
+            "employers": {
+                employer: {**stats, "hit_rate": round(stats["hits"] / (stats["hits"] + stats["misses"]), 3)}
+                for employer, stats in sorted(self.stats.items(), key=lambda item: -sum(item[1].values()))
+            },
+        }
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from providers.fingerprinted_store import FingerprintedStore
+
+
+class ResolutionCache(FingerprintedStore):
+    """LRU cache of resolved answers keyed by (type, normalized question, options), shared across jobs.
+
+    "No answer known" is cached too. Staleness and saving are handled by FingerprintedStore.
+    """
+
+    def __init__(self, sources, max_size=2048, path=None, startup_sources=()):
+        super().__init__(sources, path, startup_sources)
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def restore(self, saved):
+        for type, question, options, answer in saved.get("entries", [])[-self.max_size :]:
+            self.entries[(type, question, tuple(options) if options is not None else None)] = answer
+
+    def clear(self):
+        self.entries.clear()
+
+    def state(self):
+        entries = [[type, question, options, answer] for (type, question, options), answer in self.entries.items()]
+        return {"entries": entries}
+
+    def get(self, key):
+        """Return (found, answer); answer may be None for a cached "no answer"."""
+        self.validate()
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, self.entries[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key, answer):
+        self.entries[key] = answer
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0,
+            "size": len(self.entries),
+            "invalidations": self.invalidations,
+        }
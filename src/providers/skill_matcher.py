@@ -0,0 +1,94 @@
+import re
+from functools import lru_cache
+
+# Other names a skill goes by in questions, keyed by the lowercase skill name without separators.
+# Extended by basic_questions.skill_aliases in config.yaml.
+DEFAULT_ALIASES = {
+    "nodejs": ["node"],
+    "javascript": ["js", "ecmascript"],
+    "typescript": ["ts"],
+    "golang": ["go"],
+    "go": ["golang"],
+    "kubernetes": ["k8s"],
+    "postgresql": ["postgres"],
+    "reactjs": ["react"],
+    "react": ["reactjs"],
+    "csharp": ["c#"],
+    "c#": ["csharp"],
+    "cplusplus": ["c++", "cpp"],
+    "c++": ["cpp"],
+}
+
+# "node.js", "node js", "node-js" and "nodejs" are all the same skill. Separators only count
+# between word characters, so ".net" keeps its dot.
+INNER_SEPARATORS = re.compile(r"(?<=\w)[\s.\-]+(?=\w)")
+
+
+def skill_key(name):
+    return INNER_SEPARATORS.sub("", str(name).lower().strip())
+
+
+def alias_pattern(alias):
+    parts = INNER_SEPARATORS.split(str(alias).lower().strip())
+    return r"[\s.\-]?".join(re.escape(part) for part in parts)
+
+
+class SkillMatcher:
+    """Finds which configured skill a question asks about, in one regex pass over the question.
+
+    Skills only match as whole words ("java" does not match "javascript"), spelling variants and
+    aliases match the same skill, and when several skills appear the longest match wins.
+    """
+
+    def __init__(self, experience, aliases=None, cache_size=1024):
+        # skill key -> (years, order); later config entries win, as they did with the old loop
+        self.skills = {}
+        spellings = {}
+        for order, entry in enumerate(experience or []):
+            for skill in entry.get("skills") or []:
+                self.skills[skill_key(skill)] = (entry.get("years"), order)
+                spellings[skill_key(skill)] = skill
+
+        merged = {key: list(names) for key, names in DEFAULT_ALIASES.items()}
+        for name, names in (aliases or {}).items():
+            merged.setdefault(skill_key(name), []).extend(names)
+
+        # Every spelling that can appear in a question -> the skill key it stands for
+        self.lookup = {}
+        patterns = set()
+        for key in self.skills:
+            for name in [spellings[key]] + merged.get(key, []):
+                self.lookup.setdefault(skill_key(name), key)
+                patterns.add(alias_pattern(name))
+        # Skills the user named themselves take precedence over an alias of the same spelling
+        for key in self.skills:
+            self.lookup[key] = key
+
+        if patterns:
+            # Longest first, so "spring boot" is tried before "spring" at the same position
+            alternation = "|".join(sorted(patterns, key=len, reverse=True))
+            self.regex = re.compile(rf"(?<![\w+#])(?:{alternation})(?![\w+#])", re.IGNORECASE)
+        else:
+            self.regex = None
+
+        self.match = lru_cache(maxsize=cache_size)(self.find_skill)
+
+    def find_skill(self, question):
+        """Return the key of the best matching skill in the question, or None."""
+        if self.regex is None:
+            return None
+        best, best_score = None, None
+        for found in self.regex.finditer(question):
+            text = skill_key(found.group())
+            key = self.lookup.get(text)
+            if key is None:
+                continue
+            score = (len(text), self.skills[key][1])
+            if best_score is None or score > best_score:
+                best, best_score = key, score
+        return best
+
+    def years(self, question):
+        """Years of experience configured for the skill the question asks about, or None."""
+        key = self.match(question)
+        return self.skills[key][0] if key is not None else None
@@ -0,0 +1,143 @@
+import time
+from contextlib import contextmanager
+
+
+class TokenBucket:
+    """Allows `rate` events per second on average, with up to `capacity` back to back."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now, scale):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate * scale)
+        self.updated = now
+
+    def delay(self, scale):
+        """Seconds until the next token, at the current scale."""
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / (self.rate * scale)
+
+
+class Request:
+    def __init__(self):
+        self.failed = False
+        self.throttled = False
+
+    def fail(self, throttled=False):
+        self.failed = True
+        self.throttled = self.throttled or throttled
+
+
+class Scheduler:
+    """Paces page loads and applications with token buckets whose rates follow how LinkedIn responds.
+
+    The configured rates are ceilings. Every request is timed: errors and responses slower than
+    target_latency scale the pace down, fast clean responses scale it back up. A throttling page
+    drops to the slowest pace and pauses for a cooldown that doubles while throttling repeats.
+    """
+
+    def __init__(
+        self,
+        page_loads_per_minute=None,
+        applications_per_hour=None,
+        burst=5,
+        target_latency=3.0,
+        min_scale=0.1,
+        cooldown=30.0,
+        max_cooldown=600.0,
+    ):
+        self.buckets = {}
+        if page_loads_per_minute:
+            self.buckets["page_load"] = TokenBucket(page_loads_per_minute / 60, burst)
+        if applications_per_hour:
+            self.buckets["application"] = TokenBucket(applications_per_hour / 3600, 1)
+        self.target_latency = target_latency
+        self.min_scale = min_scale
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self.scale = 1.0
+        self.latency = None
+        self.paused_until = 0.0
+        self.consecutive_throttles = 0
+        self.requests = {}
+        self.errors = 0
+        self.throttles = 0
+        self.waited = 0.0
+
+    @classmethod
+    def from_config(cls, config):
+        """Build from the rate_limit block; with a worker pool every process gets an equal share."""
+        settings = dict(config.get("rate_limit") or {})
+        workers = max(1, config.get("pool", {}).get("workers", 1))
+        for name in ["page_loads_per_minute", "applications_per_hour"]:
+            if settings.get(name):
+                settings[name] = settings[name] / workers
+        return cls(**settings)
+
+    def acquire(self, kind):
+        """Block until a request of this kind is allowed."""
+        self.requests[kind] = self.requests.get(kind, 0) + 1
+        bucket = self.buckets.get(kind)
+        while True:
+            now = time.monotonic()
+            delay = self.paused_until - now
+            if bucket is not None:
+                bucket.refill(now, self.scale)
+                delay = max(delay, bucket.delay(self.scale))
+            if delay <= 0:
+                break
+            self.waited += delay
+            time.sleep(delay)
+        if bucket is not None:
+            bucket.tokens -= 1
+
+    def observe(self, latency, failed=False, throttled=False):
+        if latency is not None:
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+        if throttled:
+            self.throttles += 1
+            self.consecutive_throttles += 1
+            self.scale = self.min_scale
+            pause = min(self.max_cooldown, self.cooldown * 2 ** (self.consecutive_throttles - 1))
+            self.paused_until = time.monotonic() + pause
+            print(f"Throttled by LinkedIn. Pausing for {pause:.0f}s")
+            return
+        if failed:
+            self.errors += 1
+            self.scale = max(self.min_scale, self.scale * 0.5)
+            return
+
+        self.consecutive_throttles = 0
+        if self.latency is not None and self.latency > self.target_latency:
+            self.scale = max(self.min_scale, self.scale * 0.8)
+        else:
+            self.scale = min(1.0, self.scale + 0.05)
+
+    @contextmanager
+    def request(self, kind):
+        """Acquire, then time the block; call fail() on the yielded request if it did not work."""
+        self.acquire(kind)
+        request = Request()
+        start = time.monotonic()
+        try:
+            yield request
+        except Exception:
+            self.observe(time.monotonic() - start, failed=True)
+            raise
+        self.observe(time.monotonic() - start, request.failed, request.throttled)
+
+    def report(self):
+        return {
+            "requests": dict(self.requests),
+            "errors": self.errors,
+            "throttles": self.throttles,
+            "waited": round(self.waited, 3),
+            "scale": round(self.scale, 3),
+            "latency": round(self.latency, 3) if self.latency is not None else None,
+        }
@@ -0,0 +1,197 @@
+import os
+import time
+from collections import deque
+from datetime import datetime
+from browser import create_browser, close_browser, debugger_reachable, browser_config
+from pages.Login import LoginPage
+from utils import get_context
+from writers import BufferedCsvWriter
+
+
+def process_tree_rss(pid):
+    """Resident memory in bytes of pid and all of its descendants, read from /proc; None without /proc."""
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/status") as file:
+                for line in file:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as file:
+                    stack.extend(int(child) for child in file.read().split())
+        except (OSError, ValueError):
+            if current == pid:
+                return None
+    return total
+
+
+class BrowserSupervisor:
+    """Replaces the browser between jobs once it has grown too big or too slow.
+
+    Checks, each turned off when its setting is empty or 0: jobs per browser, the JS heap of the
+    current tab (CDP Performance.getMetrics), the resident memory of the Chrome process tree and
+    the average job time of the last `window` jobs against that of the first `window` jobs after
+    launch. A job is timed from job_started to job_done, less the time the scheduler held it.
+
+    A recycle quits the browser (an attached daemon too, which create_browser then restarts when
+    browser.daemon is on), relaunches it on the same profile, validates the login and puts the
+    jobs page back on its results page. Each recycle is logged to browser_recycles.csv with the
+    average job time before it and, once `window` more jobs have run, after it.
+    """
+
+    def __init__(
+        self, jobs_page, profile_dir, credentials, attach=True, settings=None, log_name="browser_recycles.csv"
+    ):
+        self.jobs_page = jobs_page
+        self.profile_dir = profile_dir
+        self.credentials = credentials
+        self.attach = attach
+        self.log_name = log_name
+
+        settings = settings or {}
+        self.max_jobs = settings.get("max_jobs")
+        self.max_heap_mb = settings.get("max_heap_mb")
+        self.max_rss_mb = settings.get("max_rss_mb")
+        self.slowdown = settings.get("slowdown")
+        self.window = settings.get("window") or 10
+        self.check_every = settings.get("check_every") or 5
+
+        self.recycles = 0
+        self.pending_event = None
+        self.writer = None
+        self.reset()
+
+    @property
+    def browser(self):
+        return self.jobs_page.driver
+
+    def reset(self):
+        self.jobs = 0
+        self.job_start = None
+        self.baseline = []
+        self.recent = deque(maxlen=self.window)
+        self.metrics_enabled = False
+
+    def heap_mb(self):
+        try:
+            if not self.metrics_enabled:
+                self.browser.execute_cdp_cmd("Performance.enable", {})
+                self.metrics_enabled = True
+            metrics = self.browser.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        except Exception:
+            return None
+        for metric in metrics:
+            if metric["name"] == "JSHeapUsedSize":
+                return metric["value"] / 2**20
+        return None
+
+    def rss_mb(self):
+        # An attached browser is not a child of our chromedriver, so its memory cannot be read this way
+        if getattr(self.browser, "attached", False):
+            return None
+        process = getattr(getattr(self.browser, "service", None), "process", None)
+        rss = process_tree_rss(process.pid) if process is not None else None
+        return rss / 2**20 if rss is not None else None
+
+    @staticmethod
+    def average(seconds):
+        return sum(seconds) / len(seconds) if seconds else None
+
+    def job_started(self):
+        """Call when a job is opened, so that only the job itself is timed."""
+        self.job_start = (time.monotonic(), self.jobs_page.scheduler.waited)
+
+    def job_done(self):
+        """Call after every job; recycles the browser when a threshold has been crossed."""
+        self.jobs += 1
+        if self.job_start is not None:
+            # Rate limiting pauses say nothing about the browser, so they are not counted
+            started, waited = self.job_start
+            seconds = time.monotonic() - started - (self.jobs_page.scheduler.waited - waited)
+            self.job_start = None
+            if len(self.baseline) < self.window:
+                self.baseline.append(seconds)
+            self.recent.append(seconds)
+
+        if self.pending_event is not None and len(self.baseline) == self.window:
+            self.log_event(after=self.average(self.baseline))
+
+        reason = self.recycle_reason()
+        if reason:
+            self.recycle(reason)
+
+    def recycle_reason(self):
+        if self.max_jobs and self.jobs >= self.max_jobs:
+            return f"{self.jobs} jobs"
+
+        if self.slowdown and len(self.baseline) == self.window and len(self.recent) == self.window:
+            baseline, recent = self.average(self.baseline), self.average(self.recent)
+            if recent > baseline * self.slowdown:
+                return f"jobs slowed from {baseline:.1f}s to {recent:.1f}s"
+
+        if self.jobs % self.check_every == 0:
+            heap = self.heap_mb() if self.max_heap_mb else None
+            if heap is not None and heap > self.max_heap_mb:
+                return f"JS heap at {heap:.0f} MB"
+            rss = self.rss_mb() if self.max_rss_mb else None
+            if rss is not None and rss > self.max_rss_mb:
+                return f"browser RSS at {rss:.0f} MB"
+        return None
+
+    def recycle(self, reason):
+        print(f"Recycling the browser after {self.jobs} jobs: {reason}")
+        before = self.average(self.recent)
+        heap, rss = self.heap_mb(), self.rss_mb()
+
+        self.shutdown()
+        browser = create_browser(self.profile_dir, attach=self.attach)
+        LoginPage(browser).login(username=self.credentials["email"], password=self.credentials["password"])
+        self.jobs_page.driver = browser
+        self.jobs_page.restore_position()
+
+        self.recycles += 1
+        if self.pending_event is not None:
+            self.log_event()
+        self.pending_event = [
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            self.jobs,
+            reason,
+            round(heap) if heap is not None else "",
+            round(rss) if rss is not None else "",
+            round(before, 3) if before is not None else "",
+        ]
+        self.reset()
+
+    def shutdown(self, timeout=10):
+        """Quit the browser, including an attached one, so the relaunch starts from a fresh process."""
+        try:
+            if getattr(self.browser, "attached", False):
+                self.browser.execute_cdp_cmd("Browser.close", {})
+                self.browser.service.stop()
+                address = browser_config().get("debugger_address")
+                deadline = time.monotonic() + timeout
+                while debugger_reachable(address) and time.monotonic() < deadline:
+                    time.sleep(0.2)
+            else:
+                self.browser.quit()
+        except Exception as e:
+            print(f"Failed to quit the browser: {e}")
+
+    def log_event(self, after=None):
+        if self.writer is None:
+            self.writer = BufferedCsvWriter(
+                get_context().log_path(self.log_name),
+                ["TIME", "JOBS", "REASON", "HEAP_MB", "RSS_MB", "SECONDS_PER_JOB_BEFORE", "SECONDS_PER_JOB_AFTER"],
+            )
+        self.writer.write_row(self.pending_event + [round(after, 3) if after is not None else ""])
+        self.writer.flush()
+        self.pending_event = None
+
+    def close(self):
+        """Log a recycle whose after-latency window did not complete, and close the browser."""
+        if self.pending_event is not None:
+            self.log_event(self.average(self.baseline))
+        close_browser(self.browser)
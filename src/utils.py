@@ -1,70 +1,102 @@
 import os
 import yaml
-import json
-import csv
+import atexit
 from datetime import datetime
+from functools import cached_property
+from writers import BufferedCsvWriter, Checkpoint, UnpreparedQuestionLog
+from ledger import ApplicationLedger
+from scheduler import Scheduler
+from filters import JobFilter
 
-questions = []
-config = None
-unprepared_questions = []
+root_dir = os.path.join(os.path.dirname(__file__), "..")
 
-# Load the config file
-with open(os.path.join(os.path.dirname(__file__), "..", "config.yaml"), "r") as file:
-    config = yaml.safe_load(file)
 
-# Load questions
-with open(os.path.join(os.path.dirname(__file__), "..", "questions.json"), "r") as file:
-    questions = json.load(file)
+class AppContext:
+    """Config and log stores for one run. Nothing is read or created until it is first used."""
 
-# Prepare logs directory
-if not os.path.exists(config["logs_dir"]):
-    os.makedirs(config["logs_dir"])
+    def __init__(self, config_path=None, questions_path=None, logs_dir=None):
+        self.config_path = config_path or os.path.join(root_dir, "config.yaml")
+        self.questions_path = questions_path or os.path.join(root_dir, "questions.json")
+        self._logs_dir = logs_dir
 
-# Load unprepared questions
-file_path = os.path.join(config["logs_dir"], "unprepared_questions.json")
-if os.path.exists(file_path):
-    with open(file_path, "r") as file:
-        unprepared_questions = json.load(file)
-else:
-    with open(file_path, "w") as file:
-        json.dump(unprepared_questions, file)
+        # When set, record_* calls are forwarded to sink(name, job_fields, *args) instead of being written here.
+        # Pool workers use this so that only the coordinator process touches the logs.
+        self.record_sink = None
 
+    @cached_property
+    def config(self):
+        with open(self.config_path, "r") as file:
+            return yaml.safe_load(file)
 
-def record_unprepared_question(job, question, type, options=None):
-    data = {"job": job.job_id, "question": question, "type": type}
-    if options is not None:
-        data["options"] = options
-    unprepared_questions.append(data)
-    with open(file_path, "w") as file:
-        json.dump(unprepared_questions, file)
+    @cached_property
+    def logs_dir(self):
+        logs_dir = self._logs_dir or self.config["logs_dir"]
+        os.makedirs(logs_dir, exist_ok=True)
+        return logs_dir
 
+    def log_path(self, name):
+        return os.path.join(self.logs_dir, name)
 
-def record_answered_question(job, question, type, answer):
-    file_path = os.path.join(config["logs_dir"], "answered_questions.csv")
-    if not os.path.exists(file_path):
-        with open(file_path, "w") as file:
-            writer = csv.writer(file)
-            writer.writerow(["JOB_ID", "QUESTION", "TYPE", "ANSWER"])
+    @cached_property
+    def ledger(self):
+        ledger = ApplicationLedger(self.log_path("ledger.db"))
+        atexit.register(ledger.close)
+        return ledger
 
-    with open(file_path, "a") as file:
-        writer = csv.writer(file)
-        writer.writerow([job.job_id, question, type, answer])
+    @cached_property
+    def unprepared_questions(self):
+        return UnpreparedQuestionLog(
+            self.log_path("unprepared_questions.jsonl"), self.log_path("unprepared_questions.json")
+        )
 
+    @cached_property
+    def scheduler(self):
+        return Scheduler.from_config(self.config)
 
-def record_application_status(job, status, reason=None):
-    file_path = os.path.join(config["logs_dir"], "application_status.csv")
-    if not os.path.exists(file_path):
-        with open(file_path, "w") as file:
-            writer = csv.writer(file)
-            writer.writerow(
-                ["APPLICATION_DATE", "JOB_ID", "JOB_ROLE", "COMPANY", "LOCATION", "APPLICANTS", "STATUS", "REASON"]
-            )
-
-    with open(file_path, "a") as file:
-        writer = csv.writer(file)
-        writer.writerow(
+    @cached_property
+    def job_filter(self):
+        return JobFilter.from_config(self.config)
+
+    @cached_property
+    def checkpoint(self):
+        return Checkpoint(self.log_path("checkpoint.json"))
+
+    @cached_property
+    def answered_questions_writer(self):
+        return BufferedCsvWriter(self.log_path("answered_questions.csv"), ["JOB_ID", "QUESTION", "TYPE", "ANSWER"])
+
+    @cached_property
+    def application_status_writer(self):
+        return BufferedCsvWriter(
+            self.log_path("application_status.csv"),
+            ["APPLICATION_DATE", "JOB_ID", "JOB_ROLE", "COMPANY", "LOCATION", "APPLICANTS", "STATUS", "REASON"],
+        )
+
+    def record_unprepared_question(self, job, question, type, options=None):
+        if self.record_sink is not None:
+            self.record_sink("record_unprepared_question", job_fields(job), question, type, options)
+            return
+        self.ledger.record_unprepared(job.job_id, question, type, options)
+        self.unprepared_questions.record(job.job_id, question, type, options)
+
+    def record_answered_question(self, job, question, type, answer):
+        if self.record_sink is not None:
+            self.record_sink("record_answered_question", job_fields(job), question, type, answer)
+            return
+        self.answered_questions_writer.write_row([job.job_id, question, type, answer])
+        self.ledger.record_answer(job.job_id, question, type, answer)
+
+    def record_application_status(self, job, status, reason=None):
+        if self.record_sink is not None:
+            self.record_sink("record_application_status", job_fields(job), status, reason)
+            return
+        date = datetime.now().strftime("%Y-%m-%d")
+        self.ledger.record_application(
+            date, job.job_id, job.title, job.company, job.location, job.applicants, status, reason
+        )
+        self.application_status_writer.write_row(
             [
-                datetime.now().strftime("%Y-%m-%d"),
+                date,
                 job.job_id,
                 job.title,
                 job.company,
@@ -74,3 +106,49 @@ def record_application_status(job, status, reason=None):
                 reason or "",
             ]
         )
+        # One row per job, so flush answers and status together at job boundaries
+        self.answered_questions_writer.flush()
+        self.application_status_writer.flush()
+
+
+context = None
+
+
+def set_context(new_context):
+    global context
+    context = new_context
+    return context
+
+
+def get_context():
+    """Return the current context, creating a default one (which loads nothing yet) on first use."""
+    if context is None:
+        set_context(AppContext())
+    return context
+
+
+def job_fields(job):
+    return {field: getattr(job, field, "") for field in ["job_id", "title", "company", "location", "applicants"]}
+
+
+def set_record_sink(sink):
+    get_context().record_sink = sink
+
+
+def record_unprepared_question(job, question, type, options=None):
+    get_context().record_unprepared_question(job, question, type, options)
+
+
+def record_answered_question(job, question, type, answer):
+    get_context().record_answered_question(job, question, type, answer)
+
+
+def record_application_status(job, status, reason=None):
+    get_context().record_application_status(job, status, reason)
+
+
+def __getattr__(name):
+    # Keep `utils.config` and `utils.ledger` working without loading them at import time
+    if name in ["config", "ledger"]:
+        return getattr(get_context(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
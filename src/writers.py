@@ -0,0 +1,208 @@
+import atexit
+import csv
+import json
+import os
+import signal
+import tempfile
+import time
+
+writers = []
+handlers_installed = False
+
+
+class BufferedCsvWriter:
+    """Keeps one append handle open per log and writes rows in batches."""
+
+    def __init__(self, file_path, header, max_rows=50, max_delay=5.0):
+        self.file_path = file_path
+        self.header = header
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.rows = []
+        self.file = None
+        self.writer = None
+        self.last_flush = time.monotonic()
+        writers.append(self)
+        install_handlers()
+
+    def open(self):
+        self.file = open(self.file_path, "a", newline="")
+        self.writer = csv.writer(self.file)
+        # Append mode starts at the end of the file, so an empty file needs the header
+        if self.file.tell() == 0:
+            self.writer.writerow(self.header)
+
+    def write_row(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.max_rows or time.monotonic() - self.last_flush >= self.max_delay:
+            self.flush()
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        if not self.rows:
+            return
+        if self.file is None:
+            self.open()
+        rows, self.rows = self.rows, []
+        self.writer.writerows(rows)
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+
+def flush_all():
+    for writer in writers:
+        try:
+            writer.flush()
+        except Exception as e:
+            print(f"Failed to flush {writer.file_path}: {e}")
+
+
+def close_all():
+    for writer in writers:
+        try:
+            writer.close()
+        except Exception as e:
+            print(f"Failed to close {writer.file_path}: {e}")
+
+
+def _install_signal_handler(signum):
+    previous = signal.getsignal(signum)
+
+    def handler(sig, frame):
+        flush_all()
+        if callable(previous):
+            previous(sig, frame)
+        else:
+            # Exit through SystemExit so the atexit hooks still run
+            raise SystemExit(128 + sig)
+
+    try:
+        signal.signal(signum, handler)
+    except ValueError:
+        pass  # Not on the main thread
+
+
+def install_handlers():
+    """Flush buffered rows at exit and on SIGTERM/SIGHUP; done once, when the first writer is created."""
+    global handlers_installed
+    if handlers_installed:
+        return
+    handlers_installed = True
+    atexit.register(close_all)
+    _install_signal_handler(signal.SIGTERM)
+    if hasattr(signal, "SIGHUP"):
+        _install_signal_handler(signal.SIGHUP)
+
+
+def write_atomic(path, write):
+    """Write through a temp file of its own next to path, then rename it over path."""
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as file:
+            write(file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class UnpreparedQuestionLog:
+    """Append-only JSONL log of unanswered questions, deduplicated on (question, type, options).
+
+    Repeat questions only bump an in-memory count; compact() folds the counts back into the
+    JSONL file and writes the JSON list that external tools read.
+    """
+
+    def __init__(self, file_path, compacted_file_path):
+        self.file_path = file_path
+        self.compacted_file_path = compacted_file_path
+        self.entries = None
+
+    @staticmethod
+    def key(question, type, options=None):
+        return (question, type, frozenset(options) if options is not None else None)
+
+    def index(self, data):
+        key = self.key(data["question"], data["type"], data.get("options"))
+        count = data.get("count", 1)
+        if key in self.entries:
+            self.entries[key]["count"] += count
+        else:
+            self.entries[key] = {**data, "count": count}
+
+    def load(self):
+        if self.entries is not None:
+            return
+        self.entries = {}
+        if os.path.exists(self.file_path):
+            with open(self.file_path, "r") as file:
+                for line in file:
+                    if line.strip():
+                        self.index(json.loads(line))
+        elif os.path.exists(self.compacted_file_path):
+            # Migrate the old whole-file JSON log into the append-only store
+            with open(self.compacted_file_path, "r") as file:
+                for data in json.load(file):
+                    self.index(data)
+            with open(self.file_path, "w") as file:
+                for data in self.entries.values():
+                    file.write(json.dumps(data) + "\n")
+        atexit.register(self.compact)
+
+    def record(self, job_id, question, type, options=None):
+        self.load()
+        key = self.key(question, type, options)
+        if key in self.entries:
+            self.entries[key]["count"] += 1
+            return
+
+        data = {"job": job_id, "question": question, "type": type}
+        if options is not None:
+            data["options"] = options
+        data["count"] = 1
+        self.entries[key] = data
+        with open(self.file_path, "a") as file:
+            file.write(json.dumps(data) + "\n")
+
+    def compact(self):
+        if self.entries is None:
+            return
+        entries = list(self.entries.values())
+        write_atomic(self.file_path, lambda file: file.writelines(json.dumps(data) + "\n" for data in entries))
+        write_atomic(self.compacted_file_path, lambda file: json.dump(entries, file))
+
+
+class Checkpoint:
+    """Small JSON file holding where a run is, rewritten atomically whenever that changes."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.state = {}
+
+    def load(self):
+        """Return the saved state, or None when there is no usable checkpoint."""
+        try:
+            with open(self.file_path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def update(self, **fields):
+        state = {**self.state, **fields}
+        if state == self.state:
+            return
+        self.state = state
+        write_atomic(self.file_path, lambda file: json.dump(state, file))
+
+    def clear(self):
+        self.state = {}
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)